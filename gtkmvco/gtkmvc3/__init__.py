@@ -31,6 +31,8 @@ Shortcuts are provided to the following classes defined in submodules:
    :noindex:
 .. class:: ListStoreModel
    :noindex:
+.. class:: ObjectListStoreModel
+   :noindex:
 .. class:: TextBufferModel
    :noindex:
 .. class:: ModelMT
@@ -48,7 +50,8 @@ The following two functions are not exported by default, you have to prefix
 identifiers with the module name:
 """
 
-__all__ = ["Model", "TreeStoreModel", "ListStoreModel", "TextBufferModel",
+__all__ = ["Model", "TreeStoreModel", "ListStoreModel",
+           "ObjectListStoreModel", "TextBufferModel",
            "ModelMT",
            "Controller", "View", "Observer",
            "Observable",
@@ -58,7 +61,8 @@ __all__ = ["Model", "TreeStoreModel", "ListStoreModel", "TextBufferModel",
 __version = (1,0,0)
 
 # visible classes
-from gtkmvc3.model import Model, TreeStoreModel, ListStoreModel, TextBufferModel
+from gtkmvc3.model import (Model, TreeStoreModel, ListStoreModel,
+                           ObjectListStoreModel, TextBufferModel)
 from gtkmvc3.model_mt import ModelMT
 from gtkmvc3.controller import Controller
 from gtkmvc3.view import View
@@ -26,10 +26,13 @@
 import types
 import time
 
+from gi.repository import GLib
+
 from gtkmvc3.support.utils import cast_value
 from gtkmvc3.adapters.default import *
 from gtkmvc3.observer import Observer
 from gtkmvc3 import Model
+from gtkmvc3.model import MAGIC_NOTIFICATIONS
 
 class Intermediate(Observer):
     def __init__(self, model, path, adapter):
@@ -61,7 +64,7 @@ class Intermediate(Observer):
                 getattr(self.model, self.prop_name), self.path, self.adapter)
 
     def delete_next(self):
-        if self.__next__:
+        if self.next:
             self.next.delete()
             self.next = None
 
@@ -76,7 +79,7 @@ class Intermediate(Observer):
         for prop_name in self.path:
             model = getattr(model, prop_name)
         # Break encapsulation to change the model of our adapter.
-        self.adapter.relieve_model(model)
+        self.adapter.relieve_model(self.adapter._model)
         self.adapter._model = model
         self.adapter.observe_model(model)
         self.adapter.update_widget()
@@ -87,7 +90,8 @@ class Adapter (Observer):
     def __init__(self, model, prop_name,
                  prop_read=None, prop_write=None,
                  value_error=None,
-                 spurious=False, prop_cast=True):
+                 spurious=False, prop_cast=True,
+                 rate_limit=None):
         """
         Observe one property of one model instance for assignment (and nothing
         else). After you :meth:`connect_widget` those changes will be
@@ -125,6 +129,16 @@ class Adapter (Observer):
         cast or *prop_write* raise :exc:`ValueError`. It will be passed this
         adapter, the name of the property we observe (i.e. the last part of
         *prop_name*) and the value obtained from the widget.
+
+        *rate_limit* is optional. When None (the default) the widget is
+        updated every time the property changes. Otherwise updates are
+        deferred, and the widget is written once with the latest value of
+        the property: at the next GLib idle when *rate_limit* is 0, or
+        *rate_limit* milliseconds after the first change. Use this for
+        properties changing at high frequency.
+
+        .. versionadded:: 1.1.0
+           The *rate_limit* parameter.
         """
 
         # registration is delayed, as we need to create possible
@@ -143,6 +157,21 @@ class Adapter (Observer):
         # widget, in order to avoid infinite looping.
         self._itsme = False
 
+        # the GLib source of the deferred widget update, if any
+        self._rate_limit = rate_limit
+        self._pending_update = None
+
+        # commit policy for widget changes, see connect_widget. The
+        # pending commit is a GLib source when debouncing, or True
+        # when waiting for focus-out
+        self._commit = "immediate"
+        self._pending_commit = None
+
+        # the subscription to the property, and the observer method
+        # it calls, see observe_model
+        self._subscription = None
+        self._observer_meth = None
+
         self._connect_model(model)
 
     def get_property_name(self):
@@ -160,7 +189,7 @@ class Adapter (Observer):
     def connect_widget(self, wid,
                        getter=None, setter=None,
                        signal=None, arg=None, update=True,
-                       flavour=None):
+                       flavour=None, commit="immediate"):
 
         """
         Finish set-up by connecting the widget. The model was already
@@ -194,7 +223,22 @@ class Adapter (Observer):
          possibly handled for the same widget type. See
          adapters.default for further information.
 
+        *commit* tells when changes of the widget are written into the
+         model. With "immediate" (the default) the model is updated
+         every time *signal* is emitted. With a number of
+         milliseconds, the model is updated once when *signal* has
+         not been emitted for that time (e.g. after the user stopped
+         typing into an entry). With "focus-out" the model is updated
+         when the widget loses the focus or it is activated (e.g. when
+         the user presses Enter in an entry). *value_error* is called
+         at most once per update.
+
+        .. versionadded:: 1.1.0
+           The *commit* parameter.
         """
+        if not (commit in ("immediate", "focus-out") or
+                isinstance(commit, (int, float))):
+            raise ValueError("Invalid commit policy: %r" % (commit,))
 
         if wid in self._wid_info:
             raise ValueError("Widget " + str(wid) + " was already connected")
@@ -222,6 +266,14 @@ class Adapter (Observer):
             else:
                 wid.connect(signal, self._on_wid_changed)
 
+        self._commit = commit
+        if commit == "focus-out":
+            wid.connect("focus-out-event", self._on_wid_commit)
+            try:
+                wid.connect("activate", self._on_wid_commit)
+            except TypeError:
+                pass  # the widget cannot be activated
+
         self._wid = wid
 
         # updates the widget:
@@ -278,12 +330,6 @@ class Adapter (Observer):
             raise ValueError("Attribute '" + prop +
                              "' not found in model " + str(model))
 
-        # is it observable?
-        if model.has_property(prop):
-            # we need to create an observing method before registering
-            meth = types.MethodType(self._get_observer_fun(prop), self)
-            setattr(self, meth.__name__, meth)
-
         self._prop = getattr(model, prop)
         self._prop_name = prop
 
@@ -291,6 +337,44 @@ class Adapter (Observer):
         self._model = model
         self.observe_model(model)
 
+    def observe_model(self, model, weak=None):
+        """
+        Starts observing *model*, whose property is adapted when it
+        is observable. The property is observed through
+        :meth:`Model.subscribe`, so only its own notifications are
+        stored in *model*.
+
+        .. versionchanged:: 1.1.0
+           The property is no longer observed through a method named
+           after it and added to the instance.
+        """
+        Observer.observe_model(self, model, weak)
+        if (self._subscription is None and
+                model.has_property(self._prop_name)):
+            fun = self._get_observer_fun(self._prop_name)
+            kinds = [_type for _format, _, _type in MAGIC_NOTIFICATIONS
+                     if fun.__name__ == _format % self._prop_name]
+            self._observer_meth = types.MethodType(fun, self)
+
+            # a method of self, so that weak subscriptions do not keep
+            # self alive
+            self._subscription = model.subscribe(
+                self._prop_name, self._on_subscription, kinds, weak,
+                old_style_call=True,
+                spurious=self.accepts_spurious_change())
+
+    def _on_subscription(self, model, prop_name, *args):
+        """Called by the model when the adapted property changes"""
+        self._observer_meth(model, *args)
+
+    def relieve_model(self, model):
+        """Stops observing *model*, and its adapted property."""
+        if (self._subscription is not None and
+                self._subscription.model is model):
+            self._subscription.cancel()
+            self._subscription = None
+        Observer.relieve_model(self, model)
+
     def _get_observer_fun(self, prop_name):
         """This is the code for an value change observer"""
         def _observer_fun(self, model, old, new):
@@ -393,13 +477,51 @@ class Adapter (Observer):
         """Called when the widget is changed"""
         if self._itsme:
             return
+        if self._commit == "immediate":
+            self.update_model()
+        elif self._commit == "focus-out":
+            self._pending_commit = True
+        else:
+            if self._pending_commit is not None:
+                GLib.source_remove(self._pending_commit)
+            self._pending_commit = GLib.timeout_add(int(self._commit),
+                                                    self._on_commit_due)
+
+    def _on_commit_due(self):
+        """Called by GLib when changes of the widget have to be
+        committed into the model"""
+        self._pending_commit = None
         self.update_model()
+        return False
+
+    def _on_wid_commit(self, wid, *args):
+        """Called when the widget loses the focus or it is activated,
+        when the commit policy is focus-out"""
+        if self._pending_commit:
+            self._pending_commit = None
+            self.update_model()
+        return False  # lets other handlers run
 
     def _on_prop_changed(self):
         """Called by the observation code, when the value in the
         observed property is changed"""
         if self._wid and not self._itsme:
+            if self._rate_limit is None:
+                self.update_widget()
+            elif self._pending_update is None:
+                if self._rate_limit:
+                    self._pending_update = GLib.timeout_add(
+                        self._rate_limit, self._on_pending_update)
+                else:
+                    self._pending_update = GLib.idle_add(
+                        self._on_pending_update)
+
+    def _on_pending_update(self):
+        """Called by GLib when a deferred widget update is due"""
+        self._pending_update = None
+        if self._wid:
             self.update_widget()
+        return False
 
 
 #----------------------------------------------------------------------
@@ -417,11 +539,11 @@ class UserClassAdapter (Adapter):
     def __init__(self, model, prop_name,
                  getter, setter,
                  prop_read=None, prop_write=None,
-                 value_error=None, spurious=False):
+                 value_error=None, spurious=False, rate_limit=None):
 
         Adapter.__init__(self, model, prop_name,
                          prop_read, prop_write, value_error,
-                         spurious)
+                         spurious, rate_limit=rate_limit)
 
         self._getter = self._resolve_to_func(getter)
         self._setter = self._resolve_to_func(setter)
@@ -492,12 +614,12 @@ class RoUserClassAdapter (UserClassAdapter):
     def __init__(self, model, prop_name,
                  getter, setter,
                  prop_read=None, prop_write=None,
-                 value_error=None, spurious=False):
+                 value_error=None, spurious=False, rate_limit=None):
 
         UserClassAdapter.__init__(self, model, prop_name,
                                   getter, setter,
                                   prop_read, prop_write, value_error,
-                                  spurious)
+                                  spurious, rate_limit)
 
     # ----------------------------------------------------------------------
     # Private methods
@@ -25,7 +25,7 @@
 
 import types
 import weakref
-from gi.repository import Gtk
+from gi.repository import GLib, Gtk
 
 from gtkmvc3.adapters.basic import UserClassAdapter, Adapter
 
@@ -248,7 +248,7 @@ class StaticContainerAdapter (UserClassAdapter):
     pass # end of class StaticContainerAdapter
 
 class watch_items_in_tree(Observer):
-    def __init__(self, tree, column=0):
+    def __init__(self, tree, column=0, batch=False):
         """
         Observe models stored in a list for assignment to their observable
         properties, and notify the container that the row has changed.
@@ -257,28 +257,97 @@ class watch_items_in_tree(Observer):
 
         *column* is an integer adressing the column of *tree* that contains
         :class:`gtkmvc3.Model` instances.
+
+        *batch* denotes whether to collect the changed rows, and notify each
+        of them once at the next GLib idle, instead of notifying the row
+        upon each assignment. Use this when many items are updated at once.
+
+        Models in rows inserted later are observed as well.
+
+        .. versionadded:: 1.1.0
+           The *batch* parameter.
         """
         Observer.__init__(self)
+        self.tree = tree
         self.column = column
+        self.batch = batch
         self.rows = weakref.WeakKeyDictionary()
+        # rows to be notified in batch mode, and the pending GLib source
+        self.__dirty = {}
+        self.__flush_pending = False
         tree.foreach(self.on_changed)
         tree.connect('row-changed', self.on_changed)
+        tree.connect('row-inserted', self.on_changed)
 
     def on_changed(self, tree, path, iter):
         item = tree.get_value(iter, self.column)
         if item:
-            self.rows[item] = Gtk.TreeRowReference.new(model=tree, path=path)
+            row = self.rows.get(item)
+            if row is not None and self._get_row_path(item, row) == path:
+                # already watched (e.g. the change was notified by self)
+                return False
+            self.rows[item] = self._make_row(tree, path)
             item.register_observer(self)
         return False
 
+    def _make_row(self, tree, path):
+        """Returns what is kept in rows to find the row of an item
+        later"""
+        return Gtk.TreeRowReference.new(model=tree, path=path)
+
+    def _get_row_path(self, item, row):
+        """Returns the current path of the row of item, or None if
+        the row has been removed"""
+        return row.get_path() if row.valid() else None
+
     @Observer.observe('*', assign=True)
     def on_assign(self, item, prop_name, info):
         row = self.rows[item]
-        if row.valid():
-            path = row.get_path()
-            tree = row.get_model()
-            iter = tree.get_iter(path)
-            tree.row_changed(path, iter)
+        if self.batch:
+            self.__dirty[item] = row
+            if not self.__flush_pending:
+                self.__flush_pending = True
+                GLib.idle_add(self.__flush)
+            return
+        path = self._get_row_path(item, row)
+        if path is not None:
+            self.__row_changed(path)
         else:
-            item.unregister_observer(self)
-            del self.rows[item]
+            self.__forget(item)
+
+    def __forget(self, item):
+        item.unregister_observer(self)
+        del self.rows[item]
+
+    def __row_changed(self, path):
+        self.tree.row_changed(path, self.tree.get_iter(path))
+
+    def __flush(self):
+        """Notifies the rows collected in batch mode, in order"""
+        paths = []
+        for item, row in self.__dirty.items():
+            path = self._get_row_path(item, row)
+            if path is not None:
+                paths.append(path)
+            elif item in self.rows:
+                self.__forget(item)
+        self.__dirty = {}
+        self.__flush_pending = False
+        paths.sort(key=lambda path: path.get_indices())
+        for path in paths:
+            self.__row_changed(path)
+        return False
+
+
+class _watch_objects_in_store(watch_items_in_tree):
+    """Like :class:`watch_items_in_tree` for an
+    :class:`~gtkmvc3.model.ObjectListStoreModel`, whose index is used to
+    find the rows of items, instead of keeping a Gtk.TreeRowReference
+    for each of them."""
+
+    def _make_row(self, tree, path):
+        return tree
+
+    def _get_row_path(self, item, row):
+        iter = self.tree.find(item)
+        return None if iter is None else self.tree.get_path(iter)
@@ -1,4 +1,5 @@
 __all__ = ("add_adapter", "remove_adapter", "search_adapter_info",
+           "AdapterRegistry", "registry",
            "SIGNAL", "GETTER", "SETTER", "WIDTYPE", "FLAVOUR")
 
 
@@ -34,8 +35,10 @@ def __radio_action_getter_value(ra):
 # This list defines a default behavior for widgets.
 # If no particular behaviour has been specified, adapters will
 # use information contained into this list to create themself.
-# This list is ordered: the earlier a widget occurs, the sooner it
-# will be matched by the search function.
+# The search walks the MRO of the widget's class, so the entry of the
+# most specific class is matched wherever it occurs. The order of the
+# list only matters among entries with the same class and flavour:
+# the earliest one is matched.
 # ----------------------------------------------------------------------
 __def_adapter = [ # class, default signal, getter, setter, value type, flavour
 
@@ -81,6 +84,134 @@ __def_adapter = [ # class, default signal, getter, setter, value type, flavour
 WIDGET, SIGNAL, GETTER, SETTER, WIDTYPE, FLAVOUR = range(6)
 # ----------------------------------------------------------------------
 
+
+class _AdapterList (list):
+    """The list of default adapters kept by an AdapterRegistry. Any
+    modification invalidates the registry cache."""
+    def __init__(self, entries, on_change):
+        list.__init__(self, entries)
+        self._on_change = on_change
+
+
+def _changing(name):
+    meth = getattr(list, name)
+
+    def _wrapper(self, *args, **kwargs):
+        res = meth(self, *args, **kwargs)
+        self._on_change()
+        return res
+    _wrapper.__name__ = name
+    return _wrapper
+
+for _name in ("__setitem__", "__delitem__", "__iadd__", "__imul__",
+              "append", "extend", "insert", "pop", "remove", "reverse",
+              "sort", "clear"):
+    setattr(_AdapterList, _name, _changing(_name))
+
+
+class AdapterRegistry (object):
+    """
+    The set of default adapters, an ordered list of tuples (class,
+    default signal, getter, setter, value type, flavour).
+
+    Adapters are searched by walking the MRO of the widget's class,
+    so the most specific class wins. Among entries with the same
+    class and flavour, the earliest in the list wins. Results are
+    cached per (widget class, flavour), and the cache is dropped
+    whenever the list is modified.
+
+    .. versionadded:: 1.1.0
+    """
+    def __init__(self, entries=()):
+        self.__version = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__index = None  # (class, flavour) --> entry
+        self.__cache = {}  # (widget class, flavour) --> entry or None
+        self.__entries = _AdapterList(entries, self.__invalidate)
+
+    def __invalidate(self):
+        self.__version += 1
+        self.__index = None
+        self.__cache = {}
+
+    def get_entries(self):
+        """Returns the list of entries, which can be modified"""
+        return self.__entries
+
+    def get_version(self):
+        """Returns a number which changes whenever entries change"""
+        return self.__version
+
+    def get_stats(self):
+        """Returns a dict with the number of cached lookups ('hits'),
+        of searches ('misses'), of entries ('size') and of cached
+        results ('cached')"""
+        return {'hits': self.__hits, 'misses': self.__misses,
+                'size': len(self.__entries), 'cached': len(self.__cache)}
+
+    def add(self, widget_class, signal_name, getter, setter, value_type,
+            flavour=None):
+        """See add_adapter"""
+        new_tu = (widget_class, signal_name, getter, setter,
+                  value_type, flavour)
+        for it, tu in enumerate(self.__entries):
+            if issubclass(tu[WIDGET], widget_class):
+                # found an insertion point, iteration is over after inserting
+                self.__entries.insert(it, new_tu)
+                return
+
+        # simply append it
+        self.__entries.append(new_tu)
+
+    def remove(self, widget_class, flavour=None):
+        """See remove_adapter"""
+        for it, tu in enumerate(self.__entries):
+            if (widget_class == tu[WIDGET] and flavour == tu[FLAVOUR]):
+                del self.__entries[it]
+                return True
+
+        return False  # no adapter was found
+
+    def search(self, wid, flavour=None):
+        """See search_adapter_info"""
+        t = (type(wid), flavour)
+        try:
+            res = self.__cache[t]
+        except KeyError:
+            self.__misses += 1
+            res = self.__search(type(wid), flavour)
+            self.__cache[t] = res
+        else:
+            self.__hits += 1
+
+        if res is None:
+            raise TypeError("Adapter type " + str(t) +
+                            " not found among supported adapters")
+        return res
+
+    def __search(self, wid_class, flavour):
+        if self.__index is None:
+            index = {}
+            for tu in self.__entries:
+                index.setdefault((tu[WIDGET], tu[FLAVOUR]), tu)
+            self.__index = index
+
+        for cls in wid_class.__mro__:
+            tu = self.__index.get((cls, flavour))
+            if tu is not None:
+                return tu
+        return None
+
+
+registry = AdapterRegistry(__def_adapter)
+
+# the list of default adapters is still available, and it can be
+# modified directly
+__def_adapter = registry.get_entries()
+# ----------------------------------------------------------------------
+
+
 def add_adapter(widget_class, signal_name, getter, setter, value_type,
                 flavour=None):
     """This function can be used to extend at runtime the set of
@@ -90,17 +221,8 @@ def add_adapter(widget_class, signal_name, getter, setter, value_type,
 
     @param flavour can be used to differentiate otherwise identical
     entries (None for no flavour)."""
-
-    new_tu = (widget_class, signal_name, getter, setter,
-              value_type, flavour)
-    for it,tu in enumerate(__def_adapter):
-        if issubclass(tu[WIDGET], widget_class):
-            # found an insertion point, iteration is over after inserting
-            __def_adapter.insert(it, new_tu)
-            return
-
-    # simply append it
-    __def_adapter.append(new_tu)
+    registry.add(widget_class, signal_name, getter, setter, value_type,
+                 flavour)
 
 
 def remove_adapter(widget_class, flavour=None):
@@ -118,29 +240,17 @@ def remove_adapter(widget_class, flavour=None):
 
     Returns True if one adapter was removed, False if no adapter was
     removed."""
-    for it,tu in enumerate(__def_adapter):
-        if (widget_class == tu[WIDGET] and flavour == tu[FLAVOUR]):
-            del __def_adapter[it]
-            return True
-
-    return False # no adapter was found
+    return registry.remove(widget_class, flavour)
 
 
-# To optimize the search
-__memoize__ = {}
 def search_adapter_info(wid, flavour=None):
     """Given a widget returns the default tuple found in __def_adapter.
 
     @param flavour can be used to specialize the search for a
     particular tuple.
-    """
-    t = (type(wid), flavour)
-    if t in __memoize__:
-        return __memoize__[t]
 
-    for w in __def_adapter:
-        if (isinstance(wid, w[WIDGET]) and flavour == w[FLAVOUR]):
-            __memoize__[t] = w
-            return w
-
-    raise TypeError("Adapter type " + str(t) + " not found among supported adapters")
+    The most specific class of the widget is searched first (see
+    AdapterRegistry). Results are cached until the default adapters
+    are changed.
+    """
+    return registry.search(wid, flavour)
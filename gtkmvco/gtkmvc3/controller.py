@@ -23,7 +23,7 @@
 #  or to <roboogle@gmail.com>.
 
 
-import collections
+import weakref
 
 from gi.repository import GLib
 from gi.repository import Gtk
@@ -45,6 +45,56 @@ def partition(string, sep):
         return p[0], sep, p[1]
     return string, '', ''
 
+
+# controller class --> (names, triples), see _get_class_handlers
+_class_handlers = weakref.WeakKeyDictionary()
+
+
+def _get_class_handlers(cls):
+    """
+    Returns a pair (names, triples) for the given controller class.
+    names is the tuple of the names of all callable class attributes,
+    which are candidates for signal autoconnection. triples is the
+    tuple of (name, widget, signal) for all the names like
+    `on_<widget>__<signal>`.
+
+    Class attributes are inspected without being evaluated, and the
+    result is calculated once per class.
+    """
+    try:
+        return _class_handlers[cls]
+    except KeyError:
+        pass
+
+    names = []
+    for name in dir(cls):
+        for klass in cls.__mro__:
+            if name in vars(klass):
+                value = vars(klass)[name]
+                break
+        else:
+            continue
+        if isinstance(value, (staticmethod, classmethod)) or callable(value):
+            names.append(name)
+
+    res = (tuple(names), tuple(_get_handler_triples(names)))
+    _class_handlers[cls] = res
+    return res
+
+
+def _get_handler_triples(names):
+    """
+    Returns the list of (name, widget, signal) for all the given names
+    like `on_<widget>__<signal>`.
+    """
+    triples = []
+    for name in names:
+        when, _, what = partition(name, '_')
+        widget, _, signal = partition(what, '__')
+        if when == "on":
+            triples.append((name, widget, signal))
+    return triples
+
 def setup_column(widget, column=0, attribute=None, renderer=None,
     property=None, from_python=None, to_python=None, model=None):
     if not attribute:
@@ -156,17 +206,19 @@ class Controller (Observer):
         self.view = view
 
         if self.handlers == "class":
-            for name in dir(self):
-                when, _, what = partition(name, '_')
-                widget, _, signal = partition(what, '__')
-                if when == "on":
-                    try:
-                        view[widget].connect(signal, getattr(self, name))
-                    except IndexError:
-                        # Not a handler
-                        pass
-                    except KeyError:
-                        logger.warn("Widget not found for handler: %s", name)
+            names, triples = _get_class_handlers(type(self))
+            # callables stored in the instance are candidates as well
+            triples = list(triples) + _get_handler_triples(sorted(
+                name for name, value in vars(self).items()
+                if callable(value) and name not in names))
+            for name, widget, signal in triples:
+                try:
+                    view[widget].connect(signal, getattr(self, name))
+                except IndexError:
+                    # Not a handler
+                    pass
+                except KeyError:
+                    logger.warn("Widget not found for handler: %s", name)
         elif self.handlers == "glade":
             self.__autoconnect_signals()
         else:
@@ -298,6 +350,10 @@ class Controller (Observer):
               Allow incomplete auto-adaption, meaning properties for which no
               widget is found.
 
+           .. versionchanged:: 1.1.0
+              Properties for which no widget is found are reported by a
+              single warning.
+
         .. method:: adapt(ad)
            :noindex:
 
@@ -335,34 +391,46 @@ class Controller (Observer):
         In all cases, optional keyword argument ``flavour=value``
         can be used to specify a particular flavour from those
         available in :mod:`gtkmvc3.adapters.default` adapters.
+
+        Optional keyword argument ``rate_limit=value`` is passed to
+        created adapters, to defer and coalesce widget updates (see
+        :class:`Adapter`). It is ignored when adapting containers.
+
+        .. versionadded:: 1.1.0
+           The *rate_limit* keyword argument.
         """
 
         # checks arguments
         n = len(args)
 
         flavour = kwargs.get("flavour", None)
+        rate_limit = kwargs.get("rate_limit", None)
 
         if n==0:
             adapters = []
+            unmatched = []
             props = self.model.get_properties()
             # matches all properties not previoulsy adapter by the user:
-            for prop_name in (p for p in props
-                              if p not in self.__user_props):
+            for prop_name in sorted(p for p in props
+                                    if p not in self.__user_props and
+                                    p not in self.model._reserved_properties):
                 try: wid_name = self._find_widget_match(prop_name)
                 except TooManyCandidatesError as e:
                     # multiple candidates, gives up
                     raise e
-                except ValueError as e:
-                    # no widgets found for given property, continue after emitting a warning
-                    if e.args:
-                        logger.warn(e[0])
-                    else:
-                        logger.warn("No widget candidates match property '%s'"
-                            % prop_name)
+                except ValueError:
+                    # no widgets found for given property, continue
+                    unmatched.append(prop_name)
                 else:
                     logger.debug("Auto-adapting property %s and widget %s" % \
                                      (prop_name, wid_name))
-                    adapters += self.__create_adapters__(prop_name, wid_name, flavour)
+                    adapters += self.__create_adapters__(prop_name, wid_name,
+                                                         flavour, rate_limit)
+
+            if unmatched:
+                # a single warning for all properties
+                logger.warn("No widget candidates match properties: %s",
+                            ", ".join(unmatched))
 
         elif n == 1: #one argument
             if isinstance(args[0], Adapter): adapters = (args[0],)
@@ -370,7 +438,8 @@ class Controller (Observer):
             elif isinstance(args[0], str):
                 prop_name = args[0]
                 wid_name = self._find_widget_match(prop_name)
-                adapters = self.__create_adapters__(prop_name, wid_name, flavour)
+                adapters = self.__create_adapters__(prop_name, wid_name,
+                                                    flavour, rate_limit)
 
             else:
                 raise TypeError("Argument of adapt() must be either an "
@@ -383,7 +452,8 @@ class Controller (Observer):
 
             # retrieves both property and widget, and creates an adapter
             prop_name, wid_name = args
-            adapters = self.__create_adapters__(prop_name, wid_name, flavour)
+            adapters = self.__create_adapters__(prop_name, wid_name,
+                                                flavour, rate_limit)
 
         elif n == 3:
             for arg in args:
@@ -391,7 +461,7 @@ class Controller (Observer):
                     raise TypeError("names must be strings")
 
             prop_name, wid_name, gprop_name = args
-            ad = Adapter(self.model, prop_name)
+            ad = Adapter(self.model, prop_name, rate_limit=rate_limit)
             ad.connect_widget(self.view[wid_name],
                               getter=lambda w: w.get_property(gprop_name),
                               setter=lambda w, v: w.set_property(gprop_name, v),
@@ -422,13 +492,15 @@ class Controller (Observer):
         Subclasses can customise this. No super call necessary. The default
         implementation converts *prop_name* to lower case and allows prefixes
         like ``entry_``.
+
+        .. versionchanged:: 1.1.0
+           Candidates are looked up in the index of widget names kept by
+           the view (see :meth:`View.get_names_ending_with`), instead of
+           iterating over the view.
         """
-        names = []
-        for wid_name in self.view:
-            # if widget names ends with given property name: we skip
-            # any prefix in widget name
-            if wid_name.lower().endswith(prop_name.lower()):
-                names.append(wid_name)
+        # if widget names ends with given property name: we skip
+        # any prefix in widget name
+        names = list(self.view.get_names_ending_with(prop_name))
 
         if len(names) == 0:
             raise ValueError("No widget candidates match property '%s': %s" % \
@@ -445,13 +517,13 @@ class Controller (Observer):
     def __autoconnect_signals(self):
         """This is called during view registration, to autoconnect
         signals in glade file with methods within the controller"""
-        dic = {}
-        for name in dir(self):
-            method = getattr(self, name)
-            if (not isinstance(method, collections.Callable)):
-                continue
-            assert(name not in dic) # not already connected!
-            dic[name] = method
+        # candidates are taken from the class, and bound here. Only
+        # callables stored in the instance are searched for
+        dic = dict((name, value) for name, value in vars(self).items()
+                   if callable(value))
+        for name in _get_class_handlers(type(self))[0]:
+            if name not in dic:
+                dic[name] = getattr(self, name)
 
         # autoconnects glade in the view (if available any)
         for xml in self.view.glade_xmlWidgets:
@@ -461,7 +533,8 @@ class Controller (Observer):
         if self.view._builder is not None:
             self.view._builder_connect_signals(dic)
 
-    def __create_adapters__(self, prop_name, wid_name, flavour=None):
+    def __create_adapters__(self, prop_name, wid_name, flavour=None,
+                            rate_limit=None):
         """
         Private service that looks at property and widgets types,
         and possibly creates one or more (best) fitting adapters
@@ -469,6 +542,9 @@ class Controller (Observer):
 
         ``flavour`` is optionally used when a particular flavour
         must be used when seraching in default adapters.
+
+        ``rate_limit`` is passed to created adapters, except for
+        containers.
         """
         res = []
 
@@ -482,7 +558,8 @@ class Controller (Observer):
             ad = RoUserClassAdapter(self.model, prop_name,
                                     lambda d: d.year,
                                     lambda d,y: d.replace(year=y),
-                                    spurious=self.accepts_spurious_change())
+                                    spurious=self.accepts_spurious_change(),
+                                    rate_limit=rate_limit)
             ad.connect_widget(wid, lambda c: c.get_date()[0],
                               lambda c,y: c.select_month(c.get_date()[1], y),
                               "day-selected", flavour=flavour)
@@ -491,7 +568,8 @@ class Controller (Observer):
             ad = RoUserClassAdapter(self.model, prop_name,
                                     lambda d: d.month,
                                     lambda d,m: d.replace(month=m),
-                                    spurious=self.accepts_spurious_change())
+                                    spurious=self.accepts_spurious_change(),
+                                    rate_limit=rate_limit)
             ad.connect_widget(wid, lambda c: c.get_date()[1]+1,
                               lambda c,m: c.select_month(m-1, c.get_date()[0]),
                               "day-selected", flavour=flavour)
@@ -500,7 +578,8 @@ class Controller (Observer):
             ad = RoUserClassAdapter(self.model, prop_name,
                                     lambda d: d.day,
                                     lambda d,v: d.replace(day=v),
-                                    spurious=self.accepts_spurious_change())
+                                    spurious=self.accepts_spurious_change(),
+                                    rate_limit=rate_limit)
             ad.connect_widget(wid, lambda c: c.get_date()[2],
                               lambda c,d: c.select_day(d),
                               "day-selected", flavour=flavour)
@@ -518,7 +597,8 @@ class Controller (Observer):
         except TypeError as e:
             # falls back to a simple adapter
             ad = Adapter(self.model, prop_name,
-                         spurious=self.accepts_spurious_change())
+                         spurious=self.accepts_spurious_change(),
+                         rate_limit=rate_limit)
             ad.connect_widget(wid, flavour=flavour)
             res.append(ad)
 
@@ -22,9 +22,11 @@
 #  Please report bugs to <https://github.com/roboogle/gtkmvc3/issues>
 #  or to <roboogle@gmail.com>.
 
+import collections
+import contextlib
 import inspect
 import types
-import functools
+import weakref
 
 from gi.repository import Gtk
 
@@ -35,13 +37,155 @@ from gtkmvc3.observer import Observer, NTInfo
 from gtkmvc3.observable import Signal
 from gtkmvc3.support.log import logger
 from gtkmvc3.support import decorators
-from gtkmvc3.support.utils import getmembers
 
 
 # Pass prop_name to this method?
 WITH_NAME = True
 WITHOUT_NAME = False
 
+# magic names of old style notification methods, with their number
+# of arguments and the corresponding notification type
+MAGIC_NOTIFICATIONS = (("property_%s_signal_emit", 3, 'signal'),
+                       ("property_%s_value_change", 4, 'assign'),
+                       ("property_%s_before_change", 6, 'before'),
+                       ("property_%s_after_change", 7, 'after'),
+                       )
+
+# notification types, in the order they are searched in the
+# keyword arguments of observing methods
+NOTIFICATION_TYPES = ('assign', 'before', 'after', 'signal')
+
+# used in batches to mark values to be calculated when the batch ends
+_UNKNOWN = object()
+
+# observer class --> model class --> tuple of (prop_name, resolved)
+# where resolved is a tuple of (function, type, kwargs|None). This is
+# used to avoid searching the notifications every time an observer
+# is registered to a model.
+_resolved_notifications = weakref.WeakKeyDictionary()
+
+
+def _skip(args, event):
+    """The call of notification entries which have been removed"""
+    pass
+
+
+class _NotificationList (object):
+    """
+    The notification entries of one property for one type of
+    notification, in the order they were added. Entries are keyed,
+    so they are added and removed in O(1).
+
+    Iteration goes through a tuple rebuilt after changes, so entries
+    can be added and removed while notifications are being sent.
+    Removed entries are disabled, so that they are not called
+    anymore by iterations in progress.
+    """
+    __slots__ = ("__entries", "__snapshot")
+
+    def __init__(self):
+        self.__entries = collections.OrderedDict()
+        self.__snapshot = ()
+
+    def __iter__(self):
+        snapshot = self.__snapshot
+        if snapshot is None:
+            snapshot = self.__snapshot = tuple(self.__entries.values())
+        return iter(snapshot)
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __contains__(self, key):
+        return key in self.__entries
+
+    def add(self, key, entry):
+        self.__entries[key] = entry
+        self.__snapshot = None
+
+    def pop(self, key):
+        entry = self.__entries.pop(key)
+        entry[3] = _skip
+        self.__snapshot = None
+        return entry
+
+
+def _value_kind(value):
+    """Returns the kind of a property value, which determines the
+    notifications it supports"""
+    if isinstance(value, Signal):
+        return 'signal'
+    if isinstance(value, ObsWrapperBase):
+        return 'wrapper'
+    return 'value'
+
+
+class Subscription (object):
+    """
+    The handle returned by :meth:`Model.subscribe`. Call
+    :meth:`cancel` to stop the notifications.
+
+    To the model a subscription looks like an observer whose
+    observing method is the callback, for the subscribed properties
+    only.
+
+    .. versionadded:: 1.1.0
+    """
+    __slots__ = ("model", "prop_names", "__method", "__kwargs",
+                 "__func", "__owner", "__weakref__")
+
+    def __init__(self, model, prop_names, callback, kwargs, weak=False):
+        self.model = model
+        self.prop_names = prop_names
+        self.__kwargs = kwargs
+        owner = getattr(callback, "__self__", None)
+        if weak and owner is not None:
+            # the model stores _notify, which does not keep the
+            # instance of the callback alive
+            self.__func = callback.__func__
+            self.__owner = weakref.ref(owner, lambda ref: self.cancel())
+            self.__method = self._notify
+        else:
+            self.__owner = None
+            self.__method = callback
+
+    @property
+    def callback(self):
+        """The callback, or None if it was bound to an instance which
+        has been collected."""
+        if self.__owner is None:
+            return self.__method
+        owner = self.__owner()
+        if owner is None:
+            return None
+        return types.MethodType(self.__func, owner)
+
+    def cancel(self):
+        """Stops the notifications. Does nothing if already called."""
+        self.model.unsubscribe(self)
+
+    def _notify(self, *args):
+        """Calls the callback of a weak subscription, if its instance
+        is still alive"""
+        owner = self.__owner()
+        if owner is not None:
+            self.__func(owner, *args)
+
+    # the part of the Observer interface used by models
+    def has_dynamic_notifications(self):
+        return True
+
+    def accepts_spurious_change(self):
+        return False
+
+    def get_observing_methods(self, prop_name):
+        if prop_name in self.prop_names:
+            return set((self.__method,))
+        return set()
+
+    def get_observing_method_kwargs(self, prop_name, method):
+        return self.__kwargs
+
 
 def count_leaves(x):
     """
@@ -69,10 +213,24 @@ class Model (Observer):
 
        *Logical properties* require a getter and may have a setter method in
        the class.
+
+    .. attribute:: weak_observers
+
+       Class attribute. If True, observers are registered with weak
+       references by default, see :meth:`register_observer`.
+
+       .. versionadded:: 1.1.0
     """
 
     __properties__ = {}  # override this
 
+    # default for the weak parameter of register_observer
+    weak_observers = False
+
+    # observable properties defined by the framework, which
+    # Controller.adapt() does not adapt automatically
+    _reserved_properties = frozenset()
+
     # these classes are used internally and by metaclass only
     class __setinfo:
         def __init__(self, func, has_args):
@@ -80,10 +238,11 @@ class Model (Observer):
             self.has_args = has_args
 
     class __getinfo:
-        def __init__(self, func, has_args, deps=()):
+        def __init__(self, func, has_args, deps=(), cache=False):
             self.func = func
             self.has_args = has_args
             self.deps = deps
+            self.cache = cache
 
     @classmethod
     @decorators.good_decorator_accepting_args
@@ -109,11 +268,21 @@ class Model (Observer):
         are the properties (both logical and concrete) which the
         logical property depends on.
 
+        If optional `cache` is True, the value returned by the getter
+        is memoized in the instance, and the getter is called again
+        only when the value is read after any of the properties in
+        `deps` (or the logical property itself) have been assigned or
+        mutated. Use this only when `deps` lists everything the value
+        depends on.
+
         .. versionadded:: 1.99.1
            Introduced the decorator.
 
         .. versionchanged:: 1.99.2
            Added optional *deps* parameter.
+
+        .. versionchanged:: 1.1.0
+           Added optional *cache* parameter.
         """
 
         @decorators.good_decorator
@@ -131,7 +300,8 @@ class Model (Observer):
                 if _func.__name__ in _dict:
                     # error: the name is used multiple times
                     raise ValueError("The same pattern is used multiple times")
-                _dict[_func.__name__] = cls.__getinfo(_func, False, deps)
+                _dict[_func.__name__] = cls.__getinfo(_func, False, deps,
+                                                      cache)
             else:
                 # annotates getters for all names
                 for name in names:
@@ -139,7 +309,7 @@ class Model (Observer):
                         # error: the name is used multiple times
                         raise ValueError("The same pattern is "
                                          "used multiple times")
-                    _dict[name] = cls.__getinfo(_func, True, deps)
+                    _dict[name] = cls.__getinfo(_func, True, deps, cache)
 
             # here we can return whatever, it will in anycase
             # substituted by the metaclass constructor, to be a
@@ -151,6 +321,7 @@ class Model (Observer):
             # the decorated function)
             names = []  # names is used in __decorator @UnusedVariable
             deps = ()  # deps is used in __decorator @UnusedVariable
+            cache = False  # cache is used in __decorator @UnusedVariable
             return __decorator(args[0])
 
         # Here decorator is used with arguments
@@ -170,14 +341,16 @@ class Model (Observer):
                                 "'%s' must be strings" % \
                                 metaclasses.KWARG_NAME_DEPS)
 
-        # deps is the only supported keyword argument
-        unsupported = set(kwargs) - set((metaclasses.KWARG_NAME_DEPS,))
+        # deps and cache are the only supported keyword arguments
+        unsupported = set(kwargs) - set((metaclasses.KWARG_NAME_DEPS,
+                                         metaclasses.KWARG_NAME_CACHE))
         if unsupported:
             logger.warn("%s are unrecognized keyword arguments",
                         str(unsupported))
 
         names = args  # names is used in __decorator
         deps = _deps  # deps is used in __decorator
+        cache = bool(kwargs.get(metaclasses.KWARG_NAME_CACHE, False))
 
         return __decorator
     # ----------------------------------------------------------------------
@@ -252,21 +425,30 @@ class Model (Observer):
     def __init__(self):
         Observer.__init__(self)
 
-        self.__observers = []
+        # id(observer) --> observer, or a weakref.ref to it for
+        # observers registered with weak references
+        self.__observers = collections.OrderedDict()
 
-        # keys are properties names, values are pairs (method,
-        # kwargs|None) inside the observer. kwargs is the keyword
-        # argument possibly specified when explicitly defining the
-        # notification method in observers, and it is used to build
-        # the NTInfo instance passed down when the notification method
-        # is invoked. If kwargs is None (special case), the
-        # notification method is "old style" (property_<name>_...) and
-        # won't be receiving the property name.
+        # keys are properties names, values are _NotificationList
+        # containing the entries built by __make_notification, keyed
+        # by __notification_key.
         self.__value_notifications = {}
         self.__instance_notif_before = {}
         self.__instance_notif_after = {}
         self.__signal_notif = {}
 
+        # number of notifications stored in the four maps above, per
+        # property and in total. These are kept up to date when
+        # notifications are added/removed, so that setters can
+        # cheaply know whether anybody is listening.
+        self.__subscribers = {}
+        self.__subscribers_count = 0
+
+        # notifications stored per observer, to remove them without
+        # searching: id(observer) --> prop_name --> list of
+        # (_NotificationList, key, when)
+        self.__subscriptions = {}
+
         for key in self.get_properties(): self.register_property(key)
 
         # here OPs dependencies are reversed and pre-calculated
@@ -277,89 +459,79 @@ class Model (Observer):
         # involved.
         self._notify_stack = []
 
-    def _has_observer(self):
-        return bool(count_leaves((self.__value_notifications,
-            self.__instance_notif_before, self.__instance_notif_after,
-            self.__signal_notif)))
+        # batch nesting level, and changes recorded during the batch:
+        # prop name --> [old value, new value]
+        self.__batch_depth = 0
+        self.__batch_changes = collections.OrderedDict()
+
+        # values of cached logical properties: prop name --> value
+        self.__logical_cache = {}
+
+    def _has_observer(self, prop_name=None):
+        """Returns True if any notification is currently stored for
+        the given property, or for any property if prop_name is
+        None. This is O(1), as counters are maintained incrementally
+        when notifications are added and removed."""
+        if prop_name is None:
+            return self.__subscribers_count > 0
+        return self.__subscribers.get(prop_name, 0) > 0
+
+    def _is_observed(self):
+        """Returns True if at least one observer is registered,
+        regardless of the notifications it stored."""
+        return bool(self.__observers)
+
+    def __iter_observers(self):
+        """Returns the list of registered observers, weak ones
+        included"""
+        res = []
+        for observer in list(self.__observers.values()):
+            if isinstance(observer, weakref.ref):
+                observer = observer()
+                if observer is None:
+                    continue
+            res.append(observer)
+        return res
+
+    def __is_registered(self, observer):
+        stored = self.__observers.get(id(observer))
+        if isinstance(stored, weakref.ref):
+            stored = stored()
+        return stored is observer and stored is not None
+
+    def __count_subscription(self, prop_name, delta):
+        """Internal service updating the number of stored
+        notifications for prop_name by delta"""
+        self.__subscribers[prop_name] = (
+            self.__subscribers.get(prop_name, 0) + delta)
+        self.__subscribers_count += delta
 
     def _calculate_logical_deps(self):
-        """Internal service which calculates dependencies information
+        """Internal service which retrieves dependencies information
         based on those given with getters.
 
-        The graph has to be reversed, as the getter tells that a
-        property depends on a set of others, but the model needs to
-        know how has to be notified (i.e. needs to know which OP is
-        affected by an OP).  Only proximity of edges is considered,
-        the rest is demanded at runtime)
-
-        Result is stored inside internal dict __log_prop_deps which
-        represents the dependencies graph.
-        """
-        self.__log_prop_deps = {}  # the result goes here
-
-        # this is used in messages
-        _mod_cls = "%s.%s" % (self.__class__.__module__,
-                              self.__class__.__name__)
-
-        logic_ops = ((name, opr.deps)
-                     for name, opr in getmembers(type(self),
-  lambda x: isinstance(x, metaclasses.ObservablePropertyMeta.LogicalOP)
-                                                ))
-        # reverses the graph
-        for name, deps in logic_ops:
-            for dep in deps:
-                if not self.has_property(dep):
-                    raise ValueError("In class %s dependencies of logical "
-                                     "property '%s' refer non-existant "
-                                     "OP '%s'" % (_mod_cls, name, dep))
-                rdeps = self.__log_prop_deps.get(dep, [])
-                # name must appear only once in DAG
-                assert name not in rdeps
-                rdeps.append(name)
-                self.__log_prop_deps[dep] = rdeps
-
-        # emits debugging info about dependencies
-        for name, rdeps in self.__log_prop_deps.items():
-            logger.debug("In class %s changes to OP %s affects "
-                         "logical OPs: %s",
-                         _mod_cls, name, ", ".join(rdeps))
-
-        # --------------------------------------------------
-        # Here the graph is checked to be a DAG
-        # --------------------------------------------------
-        graph = dict((prop, frozenset(deps))
-                     for prop, deps in self.__log_prop_deps.items())
-
-        # makes the graph total
-        graph.update((prop, frozenset())
-                     for prop in functools.reduce(set.union,
-                                                  map(set, graph.values()),
-                                                  set()) - set(graph.keys()))
-        # DFS searching for leaves
-        while True:
-            leaves = frozenset(prop for prop, deps in graph.items()
-                               if not deps)
-            if not leaves:
-                break
-            # remove leaves from graph
-            graph = dict((prop, (deps - leaves))
-                         for prop, deps in graph.items()
-                         if prop not in leaves)
-
-        # here remaining vertex are in a loop (over-approximated)
-        if graph:
-            raise ValueError("In class %s found a loop among logical OPs: %s"\
-                                 % (_mod_cls, ", ".join(graph.keys())))
-
-        # here the graph is a DAG
-        return
+        The (reversed) dependencies graph is calculated once per
+        class by the metaclass, and it is shared read-only among all
+        instances. Raises ValueError if the dependencies declared in
+        the class are not valid (e.g. they contain a loop).
+
+        Result is stored inside internal dicts __log_prop_deps which
+        represents the dependencies graph, and __log_prop_closure
+        which maps each property to all the logical properties which
+        are affected by its changes.
+        """
+        deps = getattr(type(self), metaclasses.LOGICAL_DEPS_NAME)
+        if isinstance(deps, ValueError):
+            raise ValueError(*deps.args)
+
+        self.__log_prop_deps, self.__log_prop_closure = deps
 
     def register_property(self, name):
         """Registers an existing property to be monitored, and sets up
         notifiers for notifications."""
 
         if name not in self.__value_notifications:
-            self.__value_notifications[name] = []
+            self.__value_notifications[name] = _NotificationList()
 
         # registers observable wrappers
         prop = self.__get_prop_value(name)
@@ -369,39 +541,145 @@ class Model (Observer):
 
             if isinstance(prop, Signal):
                 if name not in self.__signal_notif:
-                    self.__signal_notif[name] = []
+                    self.__signal_notif[name] = _NotificationList()
             else:
                 if name not in self.__instance_notif_before:
-                    self.__instance_notif_before[name] = []
+                    self.__instance_notif_before[name] = _NotificationList()
                 if name not in self.__instance_notif_after:
-                    self.__instance_notif_after[name] = []
+                    self.__instance_notif_after[name] = _NotificationList()
 
     def has_property(self, name):
         """Returns true if given property name refers an observable
         property inside self or inside derived classes."""
         return name in self.get_properties()
 
-    def register_observer(self, observer):
+    def register_observer(self, observer, weak=None):
         """Register given observer among those observers which are
-        interested in observing the model."""
-        if observer in self.__observers: return  # not already registered
+        interested in observing the model.
+
+        If *weak* is True the model does not keep *observer* alive:
+        when it is garbage collected it is unregistered
+        automatically. If None, :attr:`weak_observers` is used.
+        Notifications of weak observers are slightly slower.
+
+        .. versionchanged:: 1.1.0
+           Added the *weak* parameter.
+        """
+        if self.__is_registered(observer): return  # already registered
 
         assert isinstance(observer, Observer)
-        self.__observers.append(observer)
-        for key in self.get_properties():
-            self.__add_observer_notification(observer, key)
+        if weak is None:
+            weak = self.weak_observers
+        oid = id(observer)
+        if weak:
+            self.__observers[oid] = weakref.ref(observer,
+                                                self.__make_purge(oid))
+        else:
+            self.__observers[oid] = observer
+        for key, resolved in self.__get_observer_notifications(observer):
+            self.__add_observer_notification(observer, key, resolved)
 
     def unregister_observer(self, observer):
         """Unregister the given observer that is no longer interested
         in observing the model."""
         assert isinstance(observer, Observer)
 
-        if observer not in self.__observers:
+        if not self.__is_registered(observer):
             return
-        for key in self.get_properties():
-            self.__remove_observer_notification(observer, key)
+        oid = id(observer)
+        self.__remove_subscriptions(oid, observer.__class__.__name__)
+        del self.__observers[oid]
 
-        self.__observers.remove(observer)
+    def subscribe(self, prop_names, callback, kinds=("assign",), weak=None,
+                  **kwargs):
+        """
+        Calls *callback* for the notifications of the given kinds on
+        the given properties only, without registering an observer.
+        This does not depend on the number of properties of the model.
+
+        *prop_names* a property name, or a sequence of names. Patterns
+        are not supported.
+
+        *callback* is called like the methods declared with
+        :meth:`Observer.observe`, i.e. with the model, the property name
+        and the :class:`NTInfo` instance.
+
+        *kinds* a sequence of notification types among ``'assign'``,
+        ``'before'``, ``'after'`` and ``'signal'``.
+
+        If *weak* is True and *callback* is a bound method, its instance
+        is not kept alive by the model: when it is garbage collected the
+        subscription is cancelled. If None, :attr:`weak_observers` is
+        used, as for :meth:`register_observer`.
+
+        *kwargs* are handled like the keyword arguments of
+        :meth:`Observer.observe`, e.g. ``spurious``.
+
+        Returns a :class:`Subscription`.
+
+        .. versionadded:: 1.1.0
+        """
+        if isinstance(prop_names, str):
+            prop_names = (prop_names,)
+        prop_names = frozenset(prop_names)
+        unknown = prop_names - self.get_properties()
+        if unknown:
+            raise ValueError("Model %s has no properties %s" %
+                             (self.__class__.__name__,
+                              ", ".join(sorted(unknown))))
+        for kind in kinds:
+            if kind not in NOTIFICATION_TYPES:
+                raise ValueError("Unknown notification type '%s'" % kind)
+            kwargs[kind] = True
+        if weak is None:
+            weak = self.weak_observers
+
+        subscription = Subscription(self, prop_names, callback, kwargs, weak)
+        method, = subscription.get_observing_methods(next(iter(prop_names)))
+        oid = id(subscription)
+        try:
+            for prop_name in prop_names:
+                self.__add_observer_notification(
+                    subscription, prop_name,
+                    [(method, kind, kwargs) for kind in kinds])
+        except:
+            self.__remove_subscriptions(oid, "Subscription")
+            raise
+        # registered only once all its notifications are stored
+        self.__observers[oid] = subscription
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """
+        Stops the notifications of the given :class:`Subscription`,
+        like :meth:`Subscription.cancel` does.
+
+        .. versionadded:: 1.1.0
+        """
+        oid = id(subscription)
+        if self.__observers.get(oid) is subscription:
+            self.__remove_subscriptions(oid, "Subscription")
+            del self.__observers[oid]
+
+    def __make_purge(self, oid):
+        """Returns the callback of the weak reference to the observer
+        identified by oid, which drops its notifications once it has
+        been collected. The model is referenced weakly as well."""
+        model_ref = weakref.ref(self)
+
+        def purge(ref):
+            model = model_ref()
+            if model is not None:
+                model.__purge_observer(oid, ref)
+        return purge
+
+    def __purge_observer(self, oid, ref):
+        """Removes all notifications of the collected observer
+        identified by oid"""
+        if self.__observers.get(oid) is not ref:
+            return
+        self.__remove_subscriptions(oid, "<collected>")
+        del self.__observers[oid]
 
     def _reset_property_notification(self, prop_name, old=None):
         """Called when it has be done an assignment that changes the
@@ -418,9 +696,27 @@ class Model (Observer):
 
         self.register_property(prop_name)
 
-        for observer in self.__observers:
-            self.__remove_observer_notification(observer, prop_name)
-            self.__add_observer_notification(observer, prop_name)
+        # stored notifications do not depend on the instance held by
+        # the property, but only on its kind
+        same_kind = (_value_kind(old) ==
+                     _value_kind(self.__get_prop_value(prop_name)))
+        # assign notifications fit any kind
+        keep = self.__value_notifications[prop_name]
+
+        for observer in self.__iter_observers():
+            entries = self.__get_class_notifications(observer)
+            if entries is None:
+                # notifications may have been changed at runtime
+                self.__remove_observer_notification(observer, prop_name)
+                self.__add_observer_notification(observer, prop_name)
+            elif not same_kind:
+                self.__remove_subscriptions(id(observer),
+                                            observer.__class__.__name__,
+                                            (prop_name,), keep)
+                self.__add_observer_notification(
+                    observer, prop_name,
+                    [(types.MethodType(func, observer), _type, kw)
+                     for func, _type, kw in entries.get(prop_name, ())])
 
     def get_properties(self):
         """
@@ -430,9 +726,78 @@ class Model (Observer):
         """
         return getattr(self, metaclasses.ALL_OBS_SET, frozenset())
 
-    def __add_observer_notification(self, observer, prop_name):
+    def __get_observer_notifications(self, observer):
         """
-        Find observing methods and store them for later notification.
+        Return an iterable of pairs (prop_name, resolved) where
+        resolved is the list of notifications as returned by
+        :meth:`__resolve_observer_notification`.
+
+        *observer* an instance.
+
+        When notifications are taken from :meth:`__get_class_notifications`
+        only properties with at least one notification are returned.
+        """
+        entries = self.__get_class_notifications(observer)
+        if entries is None:
+            return ((key, self.__resolve_observer_notification(observer, key))
+                    for key in self.get_properties())
+
+        return ((key, [(types.MethodType(func, observer), _type, kw)
+                       for func, _type, kw in resolved])
+                for key, resolved in entries.items())
+
+    def __get_class_notifications(self, observer):
+        """
+        Return a mapping from the names of the properties with at
+        least one notification to the notifications as returned by
+        :meth:`__resolve_observer_notification`, with functions in
+        place of the methods bound to *observer*.
+
+        As the result only depends on the class of the observer and on
+        the class of the model, it is calculated once per pair of
+        classes. Return None when this is not possible, e.g. when
+        notifications of *observer* have been changed at runtime.
+        """
+        if not self.__has_class_notifications(observer):
+            return None
+
+        per_model = _resolved_notifications.setdefault(
+            type(observer), weakref.WeakKeyDictionary())
+        entries = per_model.get(type(self))
+        if entries is None:
+            entries = collections.OrderedDict()
+            for key in self.get_properties():
+                resolved = self.__resolve_observer_notification(observer,
+                                                                key)
+                if not resolved:
+                    continue
+                if any(getattr(meth, "__self__", None) is not observer
+                       for meth, _, _ in resolved):
+                    # not a plain method: it cannot be bound later
+                    return None
+                entries[key] = tuple((meth.__func__, _type, kw)
+                                     for meth, _type, kw in resolved)
+            per_model[type(self)] = entries
+        return entries
+
+    def __has_class_notifications(self, observer):
+        """Returns True if the notifications of the given observer
+        only depend on its class"""
+        cls = type(observer)
+        # overriding these may make notifications depend on the instance
+        if (cls.get_observing_methods is not
+                Observer.get_observing_methods or
+                cls.get_observing_method_kwargs is not
+                Observer.get_observing_method_kwargs):
+            return False
+        return not (observer.has_dynamic_notifications() or
+                    hasattr(cls, "__getattr__") or
+                    any(name.startswith("property_")
+                        for name in vars(observer)))
+
+    def __resolve_observer_notification(self, observer, prop_name):
+        """
+        Find observing methods for the given property.
 
         *observer* an instance.
 
@@ -441,149 +806,253 @@ class Model (Observer):
         This checks for magic names as well as methods explicitly added through
         decorators or at runtime. In the latter case the type of the
         notification is inferred from the number of arguments it takes.
+
+        Returns a list of triples (method, type, kwargs) where type is
+        one of 'assign', 'before', 'after' and 'signal', and kwargs is
+        None for old style notifications (property_<name>_...).
         """
-        value = self.__get_prop_value(prop_name)
+        res = []
 
-        # --- Some services ---
-        def getmeth(_format, numargs):
+        for _format, numargs, _type in MAGIC_NOTIFICATIONS:
             name = _format % prop_name
-            meth = getattr(observer, name)
+            try:
+                meth = getattr(observer, name)
+            except AttributeError:
+                continue
             args, varargs, _, _ = inspect.getargspec(meth)
             if not varargs and len(args) != numargs:
                 logger.warn("Ignoring notification %s: exactly %d arguments"
                     " are expected", name, numargs)
-                raise AttributeError
-
-            return meth
-
-        def add_value(notification, kw=None):
-            pair = (notification, kw)
-            if pair in self.__value_notifications[prop_name]:
-                return
-            logger.debug("Will call %s.%s after assignment to %s.%s",
-                observer.__class__.__name__, notification.__name__,
-                self.__class__.__name__, prop_name)
-            self.__value_notifications[prop_name].append(pair)
-
-        def add_before(notification, kw=None):
-            if (not isinstance(value, ObsWrapperBase) or
-                isinstance(value, Signal)):
-                return
-
-            pair = (notification, kw)
-            if pair in self.__instance_notif_before[prop_name]:
-                return
-            logger.debug("Will call %s.%s before mutation of %s.%s",
-                observer.__class__.__name__, notification.__name__,
-                self.__class__.__name__, prop_name)
-
-            self.__instance_notif_before[prop_name].append(pair)
-
-        def add_after(notification, kw=None):
-            if (not isinstance(value, ObsWrapperBase) or
-                isinstance(value, Signal)):
-                return
-
-            pair = (notification, kw)
-            if pair in self.__instance_notif_after[prop_name]:
-                return
-            logger.debug("Will call %s.%s after mutation of %s.%s",
-                observer.__class__.__name__, notification.__name__,
-                self.__class__.__name__, prop_name)
-
-            self.__instance_notif_after[prop_name].append(pair)
-
-        def add_signal(notification, kw=None):
-            if not isinstance(value, Signal):
-                return
-
-            pair = (notification, kw)
-            if pair in self.__signal_notif[prop_name]:
-                return
-            logger.debug("Will call %s.%s after emit on %s.%s",
-                observer.__class__.__name__, notification.__name__,
-                self.__class__.__name__, prop_name)
-
-            self.__signal_notif[prop_name].append(pair)
-        # ---------------------
-
-        try: notification = getmeth("property_%s_signal_emit", 3)
-        except AttributeError: pass
-        else: add_signal(notification)
-
-        try: notification = getmeth("property_%s_value_change", 4)
-        except AttributeError: pass
-        else: add_value(notification)
-
-        try: notification = getmeth("property_%s_before_change", 6)
-        except AttributeError: pass
-        else: add_before(notification)
-
-        try: notification = getmeth("property_%s_after_change", 7)
-        except AttributeError: pass
-        else: add_after(notification)
+                continue
+            res.append((meth, _type, None))
 
         # here explicit notification methods are handled (those which
         # have been statically or dynamically registered)
-        type_to_adding_method = {
-            'assign' : add_value,
-            'before' : add_before,
-            'after'  : add_after,
-            'signal' : add_signal,
-            }
-
         for meth in observer.get_observing_methods(prop_name):
-            added = False
             kw = observer.get_observing_method_kwargs(prop_name, meth)
-            for flag, adding_meth in type_to_adding_method.items():
-                if flag in kw:
-                    added = True
-                    adding_meth(meth, kw)
-
-            if not added:
+            types_ = [_type for _type in NOTIFICATION_TYPES if _type in kw]
+            if not types_:
                 raise ValueError("In %s notification method %s is "
                                  "marked to be observing property "
                                  "'%s', but no notification type "
                                  "information were specified." %
                                  (observer.__class__,
                                   meth.__name__, prop_name))
+            res.extend((meth, _type, kw) for _type in types_)
 
-    def __remove_observer_notification(self, observer, prop_name):
+        return res
+
+    def __add_observer_notification(self, observer, prop_name,
+                                    resolved=None):
         """
-        Remove all stored notifications.
+        Store observing methods for later notification.
 
         *observer* an instance.
 
         *prop_name* a string.
-        """
 
-        def side_effect(seq):
-            for meth, kw in reversed(seq):
-                if meth.__self__ is observer:
-                    seq.remove((meth, kw))
-                    yield meth
-
-        for meth in side_effect(self.__value_notifications.get(prop_name, ())):
-            logger.debug("Stop calling %s.%s after assignment to %s.%s",
-                observer.__class__.__name__, meth.__name__,
+        *resolved* is the list of notifications as returned by
+        :meth:`__resolve_observer_notification`, which is called if
+        not given. Notifications are stored only if they fit the
+        current value of the property (e.g. signal notifications are
+        stored only if the property holds a Signal).
+        """
+        if resolved is None:
+            resolved = self.__resolve_observer_notification(observer,
+                                                            prop_name)
+        value = self.__get_prop_value(prop_name)
+        is_wrapper = isinstance(value, ObsWrapperBase)
+        is_signal = isinstance(value, Signal)
+        oid = id(observer)
+        weak = isinstance(self.__observers.get(oid), weakref.ref)
+        subs = self.__subscriptions.setdefault(oid, {})
+
+        for notification, _type, kw in resolved:
+            if _type == 'assign':
+                seq = self.__value_notifications[prop_name]
+                when = "after assignment to"
+            elif _type == 'signal':
+                if not is_signal:
+                    continue
+                seq = self.__signal_notif[prop_name]
+                when = "after emit on"
+            else:
+                if not is_wrapper or is_signal:
+                    continue
+                if _type == 'before':
+                    seq = self.__instance_notif_before[prop_name]
+                    when = "before mutation of"
+                else:
+                    seq = self.__instance_notif_after[prop_name]
+                    when = "after mutation of"
+
+            key = self.__notification_key(oid, notification, kw)
+            if key in seq:
+                continue
+            logger.debug("Will call %s.%s %s %s.%s",
+                observer.__class__.__name__,
+                getattr(notification, "__name__", repr(notification)), when,
                 self.__class__.__name__, prop_name)
+            seq.add(key, self.__make_notification(observer, notification,
+                                                  prop_name, _type, kw,
+                                                  weak))
+            subs.setdefault(prop_name, []).append((seq, key, when))
+            self.__count_subscription(prop_name, 1)
+
+    @staticmethod
+    def __notification_key(oid, method, kw):
+        """Returns the key of the entry of method in a
+        _NotificationList. Old style notifications (kw is None) and
+        explicit ones of the same method are distinct."""
+        return (oid, getattr(method, "__func__", method), kw is None)
+
+    def __make_notification(self, observer, method, prop_name, _type, kw,
+                            weak=False):
+        """
+        Returns the entry stored in notification tables, which is a
+        list [method, kw, spurious, call, id(observer)].
+
+        All the decisions which depend only on the observer and on
+        the way method has been declared are taken here once:
+        *spurious* tells if value notifications are sent also when
+        the value did not change (ticket:38), and *call* is a function
+        taking the tuple of the notification arguments and the content
+        of the notification event (built once, and copied into each
+        :class:`NTInfo` instance), which calls method according to its
+        calling convention. When :meth:`__notify_observer__` is
+        overridden, method is called through it.
+
+        If *weak* is True and method is bound to *observer*, neither
+        is referenced by the entry, which stores the function of
+        method instead.
+        """
+        if kw is not None and "spurious" in kw:
+            spurious = kw['spurious']
+        else:
+            spurious = observer.accepts_spurious_change()
+
+        if weak and getattr(method, "__self__", None) is observer:
+            func = method.__func__
+            return [func, kw, spurious,
+                    self.__make_weak_call(weakref.ref(observer), func,
+                                          prop_name, kw),
+                    id(observer)]
+
+        return [method, kw, spurious,
+                self.__make_call(observer, method, prop_name, kw),
+                id(observer)]
+
+    def __make_call(self, observer, method, prop_name, kw):
+        """Returns the function calling method, see
+        :meth:`__make_notification`"""
+        if type(self).__notify_observer__ is Model.__notify_observer__:
+            # nothing in between, method is called directly
+            notify = None
+        else:
+            notify = self.__notify_observer__
+
+        if kw is None:  # old style call without name
+            if notify is None:
+                def call(args, event):
+                    method(self, *args)
+            else:
+                def call(args, event):
+                    notify(observer, method, self, *args)
+        elif 'old_style_call' in kw:  # old style call with name
+            if notify is None:
+                def call(args, event):
+                    method(self, prop_name, *args)
+            else:
+                def call(args, event):
+                    notify(observer, method, self, prop_name, *args)
+        else:
+            # New style explicit notification.
+            # notice that event content overrides any existing
+            # key:val in kw, which is precisely what it is
+            # expected to happen
+            extra = NTInfo._get_extra(kw)
+            for_observer = NTInfo._for_observer
+            if notify is None:
+                def call(args, event):
+                    method(self, prop_name, for_observer(event, extra))
+            else:
+                def call(args, event):
+                    notify(observer, method, self, prop_name,
+                           for_observer(event, extra))
+        return call
+
+    def __make_weak_call(self, observer_ref, func, prop_name, kw):
+        """Like :meth:`__make_call`, for the function *func* of a
+        method of the observer referenced by *observer_ref*. The
+        returned function does nothing once the observer is gone."""
+        if type(self).__notify_observer__ is Model.__notify_observer__:
+            invoke = func
+        else:
+            notify = self.__notify_observer__
+
+            def invoke(observer, *args):
+                notify(observer, types.MethodType(func, observer), *args)
+
+        if kw is None:  # old style call without name
+            def call(args, event):
+                observer = observer_ref()
+                if observer is not None:
+                    invoke(observer, self, *args)
+        elif 'old_style_call' in kw:  # old style call with name
+            def call(args, event):
+                observer = observer_ref()
+                if observer is not None:
+                    invoke(observer, self, prop_name, *args)
+        else:
+            extra = NTInfo._get_extra(kw)
+            for_observer = NTInfo._for_observer
+
+            def call(args, event):
+                observer = observer_ref()
+                if observer is not None:
+                    invoke(observer, self, prop_name,
+                           for_observer(event, extra))
+        return call
 
-        for meth in side_effect(self.__signal_notif.get(prop_name, ())):
-            logger.debug("Stop calling %s.%s after emit on %s.%s",
-                observer.__class__.__name__, meth.__name__,
-                self.__class__.__name__, prop_name)
+    def __remove_observer_notification(self, observer, prop_name):
+        """
+        Remove all stored notifications.
 
-        for meth in side_effect(
-                        self.__instance_notif_before.get(prop_name, ())):
-            logger.debug("Stop calling %s.%s before mutation of %s.%s",
-                observer.__class__.__name__, meth.__name__,
-                self.__class__.__name__, prop_name)
+        *observer* an instance.
 
-        for meth in side_effect(
-                        self.__instance_notif_after.get(prop_name, ())):
-            logger.debug("Stop calling %s.%s after mutation of %s.%s",
-                observer.__class__.__name__, meth.__name__,
-                self.__class__.__name__, prop_name)
+        *prop_name* a string.
+        """
+        self.__remove_subscriptions(id(observer),
+                                    observer.__class__.__name__,
+                                    (prop_name,))
+
+    def __remove_subscriptions(self, oid, observer_name, prop_names=None,
+                               keep=None):
+        """Removes the notifications stored for the observer
+        identified by oid, for the given properties or for all of
+        them, except those stored in the _NotificationList *keep*.
+        This is proportional to the number of notifications of the
+        observer for the given properties."""
+        subs = self.__subscriptions.get(oid)
+        if subs is None:
+            return
+        if prop_names is None:
+            prop_names = list(subs)
+        for prop_name in prop_names:
+            stored = subs.pop(prop_name, ())
+            kept = [sub for sub in stored if sub[0] is keep]
+            if kept:
+                subs[prop_name] = kept
+            for seq, key, when in stored:
+                if seq is keep:
+                    continue
+                meth = seq.pop(key)[0]
+                self.__count_subscription(prop_name, -1)
+                logger.debug("Stop calling %s.%s %s %s.%s",
+                    observer_name, getattr(meth, "__name__", repr(meth)),
+                    when, self.__class__.__name__, prop_name)
+        if not subs:
+            del self.__subscriptions[oid]
 
     def __notify_observer__(self, observer, method, *args, **kwargs):
         """This can be overridden by derived class in order to call
@@ -592,6 +1061,81 @@ class Model (Observer):
         calls the given method with the given arguments"""
         return method(*args, **kwargs)
 
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Return a context manager deferring value change notifications
+        until the end of the block::
+
+          with model.batch():
+              model.name = "John"
+              model.age = 42
+
+        Within the block, assignments are not notified. When the
+        block ends, each changed property is notified once, with the
+        value it had before its first assignment and the latest
+        value. Logical properties depending on the changed properties
+        are evaluated once, and notified as well.
+
+        Batches can be nested, notifications are sent when the
+        outermost one ends. To batch changes of several models, use a
+        batch for each of them::
+
+          with model1.batch(), model2.batch():
+              ...
+
+        Notifications about mutations of container properties and
+        signals are not deferred.
+
+        If the block raises an exception, the assignments made before
+        it are not undone, so they are still notified when the batch
+        ends, before the exception propagates. Observers are thus kept
+        consistent with the values actually stored in the model.
+
+        .. versionadded:: 1.1.0
+        """
+        self.__batch_depth += 1
+        try:
+            yield self
+        finally:
+            self.__batch_depth -= 1
+            if self.__batch_depth == 0:
+                self.__end_batch()
+
+    def _in_batch(self):
+        """Returns True if value change notifications are currently
+        deferred by :meth:`batch`"""
+        return self.__batch_depth > 0
+
+    def _record_property_value_change(self, prop_name, old, new):
+        """Called by the setter's code instead of notifying, while
+        a batch is in progress. Must be called before the value is
+        actually set, to collect old values of dependent logical
+        properties."""
+        changes = self.__batch_changes
+        if prop_name in changes:
+            changes[prop_name][1] = new
+        else:
+            changes[prop_name] = [old, new]
+
+        for name in self._get_logical_deps(prop_name):
+            if name in changes:
+                changes[name][1] = _UNKNOWN
+            else:
+                changes[name] = [getattr(self, name), _UNKNOWN]
+
+    def __end_batch(self):
+        """Sends the notifications recorded during a batch"""
+        changes = self.__batch_changes
+        self.__batch_changes = collections.OrderedDict()
+
+        for name, (old, new) in changes.items():
+            if not self._has_observer(name):
+                continue
+            if new is _UNKNOWN:
+                new = getattr(self, name)
+            self.notify_property_value_change(name, old, new)
+
     def __before_property_value_change__(self, prop_name):
         """This is called right before the value of a property gets
         changed, and before a property change notification is
@@ -604,27 +1148,42 @@ class Model (Observer):
         __after_property_value_change__. All this procedure is done by
         the setter's code which is generated by the metaclass."""
 
+        deps = self.__log_prop_closure.get(prop_name)
+        if not deps:
+            return ()
         return tuple((self, name, getattr(self, name))
-                     for name in self._get_logical_deps(prop_name)
-                     if name not in self._notify_stack)
+                     for name in deps
+                     if (name not in self._notify_stack and
+                         self._has_observer(name)))
 
     def _get_logical_deps(self, prop_name):
-        """Returns an iterator over a sequence of property names,
-        which has to e notified upon any value modification of
-        prop_name. used internally by __before_property_value_change__"""
-
-        if prop_name not in self.__log_prop_deps:
-            return  # stop iteration
-
-        alread_visited = set()
-        to_be_visited = self.__log_prop_deps[prop_name][:]  # copy
-        while to_be_visited:
-            x = to_be_visited.pop(0)
-            if x not in alread_visited:
-                yield x
-                alread_visited.add(x)
-                children = self.__log_prop_deps.get(x, [])
-                to_be_visited += children
+        """Returns the tuple of property names which has to be
+        notified upon any value modification of prop_name, in
+        topological order. The tuple is calculated once per class.
+        Used internally by __before_property_value_change__"""
+        return self.__log_prop_closure.get(prop_name, ())
+
+    def _get_cached_logical_value(self, prop_name, getter):
+        """Used by getters of cached logical properties. Returns the
+        memoized value of the property, calling getter if the value
+        is not known."""
+        try:
+            return self.__logical_cache[prop_name]
+        except KeyError:
+            val = getter(self)
+            self.__logical_cache[prop_name] = val
+            return val
+
+    def _invalidate_logical_cache(self, prop_name):
+        """Forgets the memoized values of the given property and of
+        all the logical properties depending on it. This is called
+        by the setter's code, and when a container property is
+        mutated."""
+        cache = self.__logical_cache
+        if cache:
+            cache.pop(prop_name, None)
+            for name in self._get_logical_deps(prop_name):
+                cache.pop(name, None)
 
     def __after_property_value_change__(self, prop_name, old_vals):
         """This is called after the value of a property is
@@ -650,32 +1209,14 @@ class Model (Observer):
         """
 
         assert prop_name in self.__value_notifications
-        for method, kw in self.__value_notifications[prop_name] :
-            obs = method.__self__
-            # spuriousness (ticket:38) is checked here
-            if kw and "spurious" in kw:
-                spurious = kw['spurious']
-            else:
-                spurious = obs.accepts_spurious_change()
-
-            # notification occurs checking spuriousness of the observer
-            if old != new or spurious:
-                if kw is None:  # old style call without name
-                    self.__notify_observer__(obs, method,
-                                             self, old, new)
-                elif 'old_style_call' in kw:  # old style call with name
-                    self.__notify_observer__(obs, method,
-                                             self, prop_name, old, new)
-                else:
-                    # New style explicit notification.
-                    # notice that named arguments overwrite any
-                    # existing key:val in kw, which is precisely what
-                    # it is expected to happen
-                    info = NTInfo('assign',
-                                  kw, model=self, prop_name=prop_name,
-                                  old=old, new=new)
-                    self.__notify_observer__(obs, method,
-                                             self, prop_name, info)
+        changed = old != new
+        args = (old, new)
+        event = {'assign': True, 'model': self, 'prop_name': prop_name,
+                 'old': old, 'new': new}
+        # notification occurs checking spuriousness of the observer
+        for _, _, spurious, call, _ in self.__value_notifications[prop_name]:
+            if changed or spurious:
+                call(args, event)
 
     def notify_method_before_change(self, prop_name, instance, meth_name,
                                     args, kwargs):
@@ -687,29 +1228,12 @@ class Model (Observer):
         *meth_name* name of the method we are about to call on *instance*.
         """
         assert prop_name in self.__instance_notif_before
-        for method, kw in self.__instance_notif_before[prop_name]:
-            obs = method.__self__
-            # notifies the change
-            if kw is None:  # old style call without name
-                self.__notify_observer__(obs, method,
-                                         self, instance,
-                                         meth_name, args, kwargs)
-            elif 'old_style_call' in kw:  # old style call with name
-                self.__notify_observer__(obs, method,
-                                         self, prop_name, instance,
-                                         meth_name, args, kwargs)
-            else:
-                # New style explicit notification.
-                # notice that named arguments overwrite any
-                # existing key:val in kw, which is precisely what
-                # it is expected to happen
-                info = NTInfo('before',
-                              kw,
-                              model=self, prop_name=prop_name,
-                              instance=instance, method_name=meth_name,
-                              args=args, kwargs=kwargs)
-                self.__notify_observer__(obs, method,
-                                         self, prop_name, info)
+        _args = (instance, meth_name, args, kwargs)
+        event = {'before': True, 'model': self, 'prop_name': prop_name,
+                 'instance': instance, 'method_name': meth_name,
+                 'args': args, 'kwargs': kwargs}
+        for _, _, _, call, _ in self.__instance_notif_before[prop_name]:
+            call(_args, event)
 
     def notify_method_after_change(self, prop_name, instance, meth_name,
                                    res, args, kwargs):
@@ -720,30 +1244,14 @@ class Model (Observer):
 
         *res* the return value of the method call.
         """
+        self._invalidate_logical_cache(prop_name)
         assert prop_name in self.__instance_notif_after
-        for method, kw in self.__instance_notif_after[prop_name]:
-            obs = method.__self__
-            # notifies the change
-            if kw is None:  # old style call without name
-                self.__notify_observer__(obs, method,
-                                         self, instance,
-                                         meth_name, res, args, kwargs)
-            elif 'old_style_call' in kw:  # old style call with name
-                self.__notify_observer__(obs, method,
-                                         self, prop_name, instance,
-                                         meth_name, res, args, kwargs)
-            else:
-                # New style explicit notification.
-                # notice that named arguments overwrite any
-                # existing key:val in kw, which is precisely what
-                # it is expected to happen
-                info = NTInfo('after',
-                              kw,
-                              model=self, prop_name=prop_name,
-                              instance=instance, method_name=meth_name,
-                              result=res, args=args, kwargs=kwargs)
-                self.__notify_observer__(obs, method,
-                                         self, prop_name, info)
+        _args = (instance, meth_name, res, args, kwargs)
+        event = {'after': True, 'model': self, 'prop_name': prop_name,
+                 'instance': instance, 'method_name': meth_name,
+                 'result': res, 'args': args, 'kwargs': kwargs}
+        for _, _, _, call, _ in self.__instance_notif_after[prop_name]:
+            call(_args, event)
 
     def notify_signal_emit(self, prop_name, arg):
         """
@@ -755,41 +1263,97 @@ class Model (Observer):
         *arg* one arbitrary argument passed to observing methods.
         """
         assert prop_name in self.__signal_notif
-        for method, kw in self.__signal_notif[prop_name]:
-            obs = method.__self__
-            # notifies the signal emit
-            if kw is None:  # old style call, without name
-                self.__notify_observer__(obs, method,
-                                         self, arg)
-            elif 'old_style_call' in kw:  # old style call with name
-                self.__notify_observer__(obs, method,
-                                         self, prop_name, arg)
-            else:
-                # New style explicit notification.
-                # notice that named arguments overwrite any
-                # existing key:val in kw, which is precisely what
-                # it is expected to happen
-                info = NTInfo('signal',
-                              kw,
-                              model=self, prop_name=prop_name, arg=arg)
-                self.__notify_observer__(obs, method,
-                                         self, prop_name, info)
+        args = (arg,)
+        event = {'signal': True, 'model': self, 'prop_name': prop_name,
+                 'arg': arg}
+        for _, _, _, call, _ in self.__signal_notif[prop_name]:
+            call(args, event)
 
     def __get_prop_value(self, name):
         """Returns the property value, given its name."""
         return getattr(self, "_prop_%s" % name, None)
 
 
+# ----------------------------------------------------------------------
+@contextlib.contextmanager
+def _detached(store, views):
+    """Detaches *views* from *store* within the context, so that they
+    refresh only once when they are attached again."""
+    for view in views:
+        view.set_model(None)
+    try:
+        yield
+    finally:
+        for view in views:
+            view.set_model(store)
+
+
+def _emit_reloaded(store, count):
+    """Emits the reloaded signal of *store*, unless a subclass defines
+    reloaded itself, or does not call the constructor of its base."""
+    signal = store.reloaded
+    if isinstance(signal, Signal):
+        signal.emit(count)
+
+
 # ----------------------------------------------------------------------
 class TreeStoreModel (
         with_metaclass(metaclasses.ObservablePropertyGObjectMeta,
                        Model, Gtk.TreeStore)):
     """Use this class as base class for your model derived by
-    Gtk.TreeStore"""
+    Gtk.TreeStore
+
+    The observable signal ``reloaded`` is emitted once by :meth:`load`,
+    with the number of rows inserted.
+
+    The name ``reloaded`` is reserved: it is not adapted by
+    :meth:`~gtkmvc3.controller.Controller.adapt`, and if a subclass
+    defines an attribute with this name, the attribute is kept and the
+    signal is not emitted.
+
+    .. versionchanged:: 1.1.0
+       Added the ``reloaded`` signal and :meth:`load`.
+    """
+
+    reloaded = None
+    __observables__ = ("reloaded",)
+    _reserved_properties = frozenset(["reloaded"])
 
     def __init__(self, column_type, *args):
         Gtk.TreeStore.__init__(self, column_type, *args)
         Model.__init__(self)
+        if self.reloaded is None:  # not defined by a subclass
+            self.reloaded = Signal()
+
+    def load(self, nodes, views=()):
+        """Replaces the content of the store with *nodes*, and emits
+        ``reloaded`` once. Returns the number of rows inserted.
+
+        *nodes* is an iterable of pairs ``(row, children)``, where *row*
+        is the sequence of column values and *children* is an iterable
+        of nodes in turn.
+
+        *views* are the Gtk.TreeView instances showing this store. They
+        are detached while rows are inserted, so that each view refreshes
+        once instead of once per row.
+
+        .. versionadded:: 1.1.0
+        """
+        count = 0
+        with _detached(self, views):
+            self.clear()
+            # depth-first, without recursion to allow deep trees
+            stack = [(None, iter(nodes))]
+            while stack:
+                parent, siblings = stack[-1]
+                for row, children in siblings:
+                    stack.append((self.append(parent, row), iter(children)))
+                    count += 1
+                    break
+                else:
+                    stack.pop()
+        _emit_reloaded(self, count)
+        return count
 
 
 # ----------------------------------------------------------------------
@@ -797,11 +1361,183 @@ class ListStoreModel (
         with_metaclass(metaclasses.ObservablePropertyGObjectMeta,
                        Model, Gtk.ListStore)):
     """Use this class as base class for your model derived by
-    Gtk.ListStore"""
+    Gtk.ListStore
+
+    The observable signal ``reloaded`` is emitted once by :meth:`extend`
+    and :meth:`replace_all`, with the number of rows inserted.
+
+    The name ``reloaded`` is reserved: it is not adapted by
+    :meth:`~gtkmvc3.controller.Controller.adapt`, and if a subclass
+    defines an attribute with this name, the attribute is kept and the
+    signal is not emitted.
+
+    .. versionchanged:: 1.1.0
+       Added the ``reloaded`` signal, :meth:`extend` and
+       :meth:`replace_all`.
+    """
+
+    reloaded = None
+    __observables__ = ("reloaded",)
+    _reserved_properties = frozenset(["reloaded"])
 
     def __init__(self, column_type, *args):
         Gtk.ListStore.__init__(self, column_type, *args)
         Model.__init__(self)
+        if self.reloaded is None:  # not defined by a subclass
+            self.reloaded = Signal()
+
+    def extend(self, rows, views=()):
+        """Appends *rows*, each a sequence of column values, and emits
+        ``reloaded`` once. Returns the number of rows inserted.
+
+        *views* are the Gtk.TreeView instances showing this store. They
+        are detached while rows are inserted, so that each view refreshes
+        once instead of once per row.
+
+        .. versionadded:: 1.1.0
+        """
+        with _detached(self, views):
+            count = self.__append_rows(rows)
+        _emit_reloaded(self, count)
+        return count
+
+    def replace_all(self, rows, views=()):
+        """Like :meth:`extend`, but removes all rows first.
+
+        .. versionadded:: 1.1.0
+        """
+        with _detached(self, views):
+            self.clear()
+            count = self.__append_rows(rows)
+        _emit_reloaded(self, count)
+        return count
+
+    def __append_rows(self, rows):
+        count = 0
+        for row in rows:
+            self.append(row)
+            count += 1
+        return count
+
+
+# ----------------------------------------------------------------------
+class ObjectListStoreModel (ListStoreModel):
+    """Use this class to hold Python objects in the first column of a
+    Gtk.ListStore, and find their rows without walking the store.
+
+    Rows are indexed by the identity of their object, and the index
+    follows insertions, removals and reordering of the rows. Objects
+    are indexed when rows are inserted with their values (e.g. by
+    ``append(row)`` or :meth:`extend`), or set through
+    :meth:`set_value`. Each object is expected to be stored in one row
+    only. Further column types can be passed to the constructor.
+
+    .. versionadded:: 1.1.0
+    """
+
+    def __init__(self, *args):
+        ListStoreModel.__init__(self, object, *args)
+        # id(obj) --> (obj, Gtk.TreeIter). Iters of a Gtk.ListStore
+        # stay valid until their row is removed, and unlike
+        # Gtk.TreeRowReference they are not updated by each insertion
+        # or removal of rows
+        self.__index = {}
+        # True when rows were deleted without going through remove or
+        # clear, so the index must be rebuilt before it is used
+        self.__stale = False
+        self.__removing = False
+        self.__watcher = None
+        self.connect('row-inserted', self.__on_row_inserted)
+        self.connect('row-deleted', self.__on_row_deleted)
+
+    def __on_row_inserted(self, model, path, iter):
+        obj = self.get_value(iter, 0)
+        if obj is not None:
+            self.__index[id(obj)] = (obj, iter.copy())
+
+    def __on_row_deleted(self, model, path):
+        if not self.__removing:
+            self.__stale = True
+
+    def __rebuild_index(self):
+        """Walks the store, which is done only after rows have been
+        deleted behind our back"""
+        self.__index = {}
+        iter = self.get_iter_first()
+        while iter is not None:
+            obj = self.get_value(iter, 0)
+            if obj is not None:
+                self.__index[id(obj)] = (obj, iter)
+            iter = self.iter_next(iter)
+        self.__stale = False
+
+    def find(self, obj):
+        """Returns the Gtk.TreeIter of the row holding *obj*, or None if
+        *obj* is not stored. This does not depend on the number of
+        rows."""
+        if self.__stale:
+            self.__rebuild_index()
+        entry = self.__index.get(id(obj))
+        if entry is None:
+            return None
+        if self.get_value(entry[1], 0) is obj:
+            return entry[1].copy()
+        # the object was replaced behind our back
+        del self.__index[id(obj)]
+        return None
+
+    def update(self, obj):
+        """Emits row-changed for the row holding *obj*. Returns False if
+        *obj* is not stored."""
+        iter = self.find(obj)
+        if iter is None:
+            return False
+        self.row_changed(self.get_path(iter), iter)
+        return True
+
+    def remove_object(self, obj):
+        """Removes the row holding *obj*. Returns False if *obj* is not
+        stored."""
+        iter = self.find(obj)
+        if iter is None:
+            return False
+        self.remove(iter)
+        return True
+
+    def set_value(self, iter, column, value):
+        if column == 0:
+            self.__index.pop(id(self.get_value(iter, 0)), None)
+        ListStoreModel.set_value(self, iter, column, value)
+        if column == 0 and value is not None:
+            self.__index[id(value)] = (value, iter.copy())
+
+    def remove(self, iter):
+        self.__index.pop(id(self.get_value(iter, 0)), None)
+        self.__removing = True
+        try:
+            return ListStoreModel.remove(self, iter)
+        finally:
+            self.__removing = False
+
+    def clear(self):
+        self.__index.clear()
+        self.__removing = True
+        try:
+            ListStoreModel.clear(self)
+        finally:
+            self.__removing = False
+        self.__stale = False
+
+    def watch_items(self, batch=False):
+        """Refreshes the row of stored :class:`Model` instances when
+        their observable properties are assigned, see
+        :class:`gtkmvc3.adapters.containers.watch_items_in_tree` for
+        *batch*. Returns the watcher, which is created once, and finds
+        rows through the index of this store."""
+        if self.__watcher is None:
+            from gtkmvc3.adapters.containers import _watch_objects_in_store
+            self.__watcher = _watch_objects_in_store(self, 0, batch)
+        return self.__watcher
 
 
 # ----------------------------------------------------------------------
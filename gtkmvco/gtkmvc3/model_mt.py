@@ -23,9 +23,14 @@
 #  or to <roboogle@gmail.com>.
 
 
+import collections
+import itertools
+import weakref
+
 from gtkmvc3.model import Model
 from gtkmvc3.support import metaclasses
 from gtkmvc3.support.porting import with_metaclass, add_metaclass
+from gtkmvc3.support.log import logger
 
 try: import threading as _threading
 except ImportError: import dummy_threading as _threading
@@ -44,23 +49,107 @@ class ModelMT (Model):
     performed by exploiting the gtk idle loop only if needed,
     otherwise the standard notification system (direct method call) is
     used. In this model, the observer is expected to run in the gtk
-    main loop thread."""
+    main loop thread.
+
+    Notifications coming from other threads are queued, and the queue
+    is drained by a single idle callback per main loop iteration.
+
+    .. attribute:: coalesce_notifications
+
+       Class attribute, False by default. When True, queued
+       assignment notifications about the same property to the same
+       observing method are coalesced: only the latest one is
+       delivered, after any notification queued before it. Before,
+       after and signal notifications are always delivered, in order.
+
+       .. versionadded:: 1.1.0
+    """
+
+    coalesce_notifications = False
 
     def __init__(self):
         Model.__init__(self)
-        self.__observer_threads = {}
+        # weak, as observers may be registered weakly
+        self.__observer_threads = weakref.WeakKeyDictionary()
         self._prop_lock = _threading.Lock()
 
-    def register_observer(self, observer):
-        Model.register_observer(self, observer)
+        # pending notifications from other threads. Keys are unique
+        # for not coalesced notifications, (method, prop_name)
+        # otherwise. Values are (method, args, kwargs)
+        self.__queue = collections.OrderedDict()
+        self.__queue_lock = _threading.Lock()
+        self.__queue_keys = itertools.count()
+        self.__drain_pending = False
+        self.__delivered = 0
+        self.__coalesced = 0
+
+        # (kind, prop_name) of the notification being dispatched, per
+        # thread
+        self.__local = _threading.local()
+
+    def register_observer(self, observer, weak=None):
+        Model.register_observer(self, observer, weak)
         self.__observer_threads[observer] = _threading.currentThread()
 
     def unregister_observer(self, observer):
         Model.unregister_observer(self, observer)
-        del self.__observer_threads[observer]
+        self.__observer_threads.pop(observer, None)
+
+    def subscribe(self, prop_names, callback, kinds=("assign",), weak=None,
+                  **kwargs):
+        subscription = Model.subscribe(self, prop_names, callback, kinds,
+                                       weak, **kwargs)
+        self.__observer_threads[subscription] = _threading.currentThread()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        Model.unsubscribe(self, subscription)
+        self.__observer_threads.pop(subscription, None)
+
+    def get_notification_stats(self):
+        """
+        Returns a dictionary with the number of notifications coming
+        from other threads which were delivered through the idle
+        loop (key ``delivered``), and the number of those which were
+        dropped as superseded by a later one (key ``coalesced``).
+
+        .. versionadded:: 1.1.0
+        """
+        with self.__queue_lock:
+            return {'delivered': self.__delivered,
+                    'coalesced': self.__coalesced}
 
     # ---------- Notifiers:
 
+    def __dispatch(self, kind, prop_name, notifier, *args):
+        """Calls notifier, recording which kind of notification about
+        prop_name is being dispatched by the current thread."""
+        prev = getattr(self.__local, 'dispatching', None)
+        self.__local.dispatching = (kind, prop_name)
+        try:
+            notifier(self, prop_name, *args)
+        finally:
+            self.__local.dispatching = prev
+
+    def notify_property_value_change(self, prop_name, old, new):
+        self.__dispatch('assign', prop_name,
+                        Model.notify_property_value_change, old, new)
+
+    def notify_method_before_change(self, prop_name, instance, meth_name,
+                                    args, kwargs):
+        self.__dispatch('before', prop_name,
+                        Model.notify_method_before_change,
+                        instance, meth_name, args, kwargs)
+
+    def notify_method_after_change(self, prop_name, instance, meth_name,
+                                   res, args, kwargs):
+        self.__dispatch('after', prop_name,
+                        Model.notify_method_after_change,
+                        instance, meth_name, res, args, kwargs)
+
+    def notify_signal_emit(self, prop_name, arg):
+        self.__dispatch('signal', prop_name, Model.notify_signal_emit, arg)
+
     def __notify_observer__(self, observer, method, *args, **kwargs):
         """This makes a call either through the gtk.idle list or a
         direct method call depending whether the caller's thread is
@@ -73,10 +162,38 @@ class ModelMT (Model):
                                              *args, **kwargs)
 
         # multi-threading call
-        GLib.idle_add(self.__idle_callback, observer, method, args, kwargs)
-
-    def __idle_callback(self, observer, method, args, kwargs):
-        method(*args, **kwargs)
+        kind, prop_name = getattr(self.__local, 'dispatching', (None, None))
+        with self.__queue_lock:
+            if self.coalesce_notifications and kind == 'assign':
+                key = (method, prop_name)
+                if self.__queue.pop(key, None) is not None:
+                    self.__coalesced += 1
+            else:
+                key = next(self.__queue_keys)
+            self.__queue[key] = (method, args, kwargs)
+
+            if not self.__drain_pending:
+                self.__drain_pending = True
+                GLib.idle_add(self.__drain_queue)
+
+    def __drain_queue(self):
+        """Delivers all the pending notifications. This is called in
+        the idle loop."""
+        with self.__queue_lock:
+            queue = self.__queue
+            self.__queue = collections.OrderedDict()
+            self.__drain_pending = False
+
+        for method, args, kwargs in queue.values():
+            try:
+                method(*args, **kwargs)
+            except Exception:
+                # one failing observer must not prevent the others
+                # from being notified
+                logger.exception("Error while notifying %s", method)
+
+        with self.__queue_lock:
+            self.__delivered += len(queue)
         return False
 
 
@@ -27,11 +27,21 @@
 import inspect
 import fnmatch
 import functools
+import os
+import re
 
 from gtkmvc3.support import decorators, log
 
 
 class NTInfo (dict):
+    """Information attached to a notification. This is a dictionary
+    whose keys are also available as attributes.
+
+    The framework builds the content once per notification event, and
+    each notified observer gets its own shallow copy of it, with the
+    keyword arguments the observer declared for the notification
+    method added.
+    """
     # At least one of the keys in this set is required when constructing
     __ONE_REQUESTED = frozenset("assign before after signal".split())
     __ALL_REQUESTED = frozenset("model prop_name".split())
@@ -51,6 +61,29 @@ class NTInfo (dict):
             if flag != _type and flag in self:
                 del self[flag]
 
+    @staticmethod
+    def _get_extra(kw):
+        """Used by the framework when an observing method is
+        registered. Returns the keyword arguments *kw* given when the
+        method was declared without the type flags, to be passed to
+        :meth:`_for_observer`."""
+        return dict((key, val) for key, val in kw.items()
+                    if key not in NTInfo.__ONE_REQUESTED)
+
+    @staticmethod
+    def _for_observer(data, extra):
+        """Used by the framework to build the instance passed to an
+        observer. *data* is the content of the notification event,
+        shared among observers and containing the type flag, and
+        *extra* is returned by :meth:`_get_extra`. Values in data
+        take precedence over those in extra. No check is carried
+        out."""
+        info = _new(NTInfo)
+        if extra:
+            _update(info, extra)
+        _update(info, data)
+        return info
+
     def __getattr__(self, name):
         """
         All dictionary keys are also available as attributes.
@@ -62,6 +95,10 @@ class NTInfo (dict):
                                  "Existing attributes are: %s" % \
                                  (name, str(self)))
 
+# the content is copied without going through __init__
+_new = dict.__new__
+_update = dict.update
+
 
 # ----------------------------------------------------------------------
 @decorators.good_decorator_accepting_args
@@ -140,6 +177,49 @@ def observes(*args):
 # this used for pattern matching
 WILDCARDS = frozenset("[]!*?")
 
+# frozenset of patterns --> matcher, see _get_matcher
+_matchers = {}
+_MAX_MATCHERS = 256
+
+# renames the groups which fnmatch.translate may create
+_GROUP_RE = re.compile(r"\(\?P([<=])")
+
+
+def _get_matcher(patterns):
+    """
+    Return a function which takes a property name and returns the
+    list of those *patterns* matching it, as :func:`fnmatch.fnmatch`
+    would do.
+
+    All the patterns are compiled into one regular expression, in
+    which each pattern is an optional lookahead, so that a name is
+    matched against all of them in one pass. Matchers are shared by
+    all the observers using the same patterns.
+    """
+    key = frozenset(patterns)
+    matcher = _matchers.get(key)
+    if matcher is not None:
+        return matcher
+
+    pats = sorted(key)
+    names = ["p%d" % i for i in range(len(pats))]
+    regex = re.compile("".join(
+        "(?:(?=(?P<%s>%s)))?" % (name, _GROUP_RE.sub(
+            r"(?P\1%s_" % name, fnmatch.translate(os.path.normcase(pat))))
+        for name, pat in zip(names, pats)))
+    by_name = dict(zip(names, pats))
+    normcase = os.path.normcase
+
+    def matcher(prop_name):
+        groups = regex.match(normcase(prop_name)).groupdict()
+        return [pat for name, pat in by_name.items()
+                if groups[name] is not None]
+
+    if len(_matchers) >= _MAX_MATCHERS:
+        _matchers.clear()
+    _matchers[key] = matcher
+    return matcher
+
 
 class Observer (object):
     """
@@ -243,6 +323,7 @@ class Observer (object):
                 raise TypeError("Third argument of observe() must be a string")
 
             self.__register_notification(name, notified, kwargs)
+            self.__dynamic_notifications = True
             return None
 
         # used statically as decorator
@@ -300,10 +381,17 @@ class Observer (object):
 
         # like __PROP_TO_METHS but only for pattern names (to optimize search)
         self.__PAT_TO_METHS = {}
+        # matches names against all the patterns above, see
+        # __get_matching_patterns
+        self.__pat_matcher = None
 
         self.__METH_TO_PAT = {}  # method --> pattern
         self.__PAT_METH_TO_KWARGS = {}  # (pattern, method) --> info
 
+        # becomes True when notifications are added or removed at
+        # runtime, making them differ from those declared in the class
+        self.__dynamic_notifications = False
+
         processed_props = set()  # tracks already processed properties
 
         # searches all custom observer methods
@@ -337,9 +425,17 @@ class Observer (object):
         if model:
             self.observe_model(model)
 
-    def observe_model(self, model):
-        """Starts observing the given model"""
-        return model.register_observer(self)
+    def observe_model(self, model, weak=None):
+        """Starts observing the given model. See
+        :meth:`Model.register_observer` for *weak*.
+
+        .. versionchanged:: 1.1.0
+           Added the *weak* parameter.
+        """
+        if weak is None:
+            # models overriding register_observer may not take weak
+            return model.register_observer(self)
+        return model.register_observer(self, weak)
 
     def relieve_model(self, model):
         """Stops observing the given model"""
@@ -352,6 +448,15 @@ class Observer (object):
         notifying a value change."""
         return self.__accepts_spurious__
 
+    def has_dynamic_notifications(self):
+        """
+        Returns True if notifications have been added with
+        :meth:`observe` or removed with :meth:`remove_observing_method`
+        at runtime. When False, the observing methods of this
+        instance are only those declared in its class.
+        """
+        return self.__dynamic_notifications
+
     def get_observing_methods(self, prop_name):
         """
         Return a possibly empty set of callables registered with
@@ -364,12 +469,22 @@ class Observer (object):
         """
         # searches in pattern and in map
         return (functools.reduce(set.union,
-                                 (meths
-                                  for pat, meths in self.__PAT_TO_METHS.items()
-                                  if fnmatch.fnmatch(prop_name, pat)),
+                                 (self.__PAT_TO_METHS[pat]
+                                  for pat in
+                                  self.__get_matching_patterns(prop_name)),
                                  set()) |
                 self.__PROP_TO_METHS.get(prop_name, set()))
 
+    def __get_matching_patterns(self, prop_name):
+        """Returns the list of the patterns in __PAT_TO_METHS
+        matching prop_name"""
+        if not self.__PAT_TO_METHS:
+            return ()
+        matcher = self.__pat_matcher
+        if matcher is None:
+            matcher = self.__pat_matcher = _get_matcher(self.__PAT_TO_METHS)
+        return matcher(prop_name)
+
     # this is done to keep backward compatibility
     get_custom_observing_methods = get_observing_methods
 
@@ -412,6 +527,7 @@ class Observer (object):
            This can revert even the effects of decorator `observe` at
            runtime. Don't.
         """
+        self.__dynamic_notifications = True
         for prop_name in prop_names:
             if prop_name in self.__PROP_TO_METHS:
                 # exact match
@@ -423,6 +539,9 @@ class Observer (object):
                 if fnmatch.fnmatch(prop_name, pat):
                     del self.__METH_TO_PAT[method]
                     self.__PAT_TO_METHS[pat].remove(method)
+                    if not self.__PAT_TO_METHS[pat]:
+                        del self.__PAT_TO_METHS[pat]
+                        self.__pat_matcher = None
 
                 del self.__PAT_METH_TO_KWARGS[(pat, method)]
 
@@ -473,6 +592,7 @@ class Observer (object):
 
             # the name contains wildcards
             _dict = self.__PAT_TO_METHS
+            self.__pat_matcher = None
 
         else:
             # check that it was not used for patterns
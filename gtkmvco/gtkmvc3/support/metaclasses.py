@@ -24,11 +24,13 @@
 
 import inspect
 import fnmatch
+import functools
 import operator
 import types
 
 import gtkmvc3.support.wrappers as wrappers
 from gtkmvc3.support.log import logger
+from gtkmvc3.support.utils import getmembers
 
 # ----------------------------------------------------------------------
 
@@ -41,6 +43,10 @@ PROPS_MAP_NAME = "__properties__"
 # This keeps the names of all observable properties (old and new)
 ALL_OBS_SET = "__all_observables__"
 
+# This keeps the (reversed) dependencies among logical properties,
+# calculated once per class
+LOGICAL_DEPS_NAME = "__logical_deps__"
+
 # name of the variable that hold a property value
 PROP_NAME = "_prop_%(prop_name)s"
 
@@ -62,8 +68,9 @@ SET_GENERIC_NAME = "set__value"
 # this used for pattern matching
 WILDCARDS = frozenset("[]!*?")
 
-# name of the keyword argument for logical getters
+# name of the keyword arguments for logical getters
 KWARG_NAME_DEPS = "deps"
+KWARG_NAME_CACHE = "cache"
 
 
 class PropertyMeta (type):
@@ -289,6 +296,9 @@ class PropertyMeta (type):
                 _getter = type(cls).get_getter(cls, name, ai_get.func,
                                                ai_get.has_args)
                 _deps = ai_get.deps
+                if ai_get.cache:
+                    _getter = type(cls).get_cached_getter(cls, name,
+                                                          _getter)
             else:
                 # old style
                 _getter = type(cls).get_getter(cls, name)
@@ -432,7 +442,7 @@ class PropertyMeta (type):
         be called in order to re-register the new property instance
         or type"""
         return (type(old) != type(new) or
-                isinstance(old, wrappers.ObsWrapperBase) and old != new)
+                isinstance(old, wrappers.ObsWrapperBase) and old is not new)
 
     def create_value(cls, prop_name, val, model=None):  # @NoSelf
         """This is used to create a value to be assigned to a
@@ -518,6 +528,16 @@ class PropertyMeta (type):
             return getattr(self, PROP_NAME % {'prop_name' : prop_name})
         return _getter
 
+    def get_cached_getter(cls, prop_name, getter):  # @NoSelf
+        """Returns a getter for a logical property which memoizes
+        the value returned by the given getter into the instance.
+        The instance has to provide methods
+        _get_cached_logical_value and _invalidate_logical_cache (see
+        class Model)."""
+        def _getter(self):
+            return self._get_cached_logical_value(prop_name, getter)
+        return _getter
+
     def get_setter(cls, prop_name,   # @NoSelf
                    user_setter=None, setter_takes_name=False,
                    user_getter=None, getter_takes_name=False):
@@ -550,8 +570,111 @@ class ObservablePropertyMeta (PropertyMeta):
 
     def __init__(cls, name, bases, _dict):  # @NoSelf
         PropertyMeta.__init__(cls, name, bases, _dict)
+
+        # dependencies are class-level information, shared by all
+        # instances. Errors are reported when the class is
+        # instantiated.
+        try:
+            deps = type(cls).__calculate_logical_deps(cls)
+        except ValueError as e:
+            deps = e
+        setattr(cls, LOGICAL_DEPS_NAME, deps)
         return
 
+    def __calculate_logical_deps(cls):  # @NoSelf
+        """Calculates dependencies information based on those given
+        with getters.
+
+        The graph has to be reversed, as the getter tells that a
+        property depends on a set of others, but the model needs to
+        know how has to be notified (i.e. needs to know which OP is
+        affected by an OP).
+
+        Returns a pair of maps. The first associates each OP to the
+        tuple of logical OPs directly depending on it. The second
+        associates each OP to the tuple of all logical OPs which are
+        (transitively) affected by its changes, in topological
+        order. Raises ValueError if dependencies are not valid."""
+        rdeps_map = {}
+
+        # this is used in messages
+        _mod_cls = "%s.%s" % (cls.__module__, cls.__name__)
+
+        all_obs = getattr(cls, ALL_OBS_SET, frozenset())
+        logic_ops = ((name, opr.deps)
+                     for name, opr in getmembers(cls,
+                          lambda x: isinstance(x, PropertyMeta.LogicalOP)))
+        # reverses the graph
+        for name, deps in logic_ops:
+            for dep in deps:
+                if dep not in all_obs:
+                    raise ValueError("In class %s dependencies of logical "
+                                     "property '%s' refer non-existant "
+                                     "OP '%s'" % (_mod_cls, name, dep))
+                rdeps = rdeps_map.setdefault(dep, [])
+                # name must appear only once in DAG
+                assert name not in rdeps
+                rdeps.append(name)
+
+        # emits debugging info about dependencies
+        for name, rdeps in rdeps_map.items():
+            logger.debug("In class %s changes to OP %s affects "
+                         "logical OPs: %s",
+                         _mod_cls, name, ", ".join(rdeps))
+
+        # --------------------------------------------------
+        # Here the graph is checked to be a DAG
+        # --------------------------------------------------
+        graph = dict((prop, frozenset(deps))
+                     for prop, deps in rdeps_map.items())
+
+        # makes the graph total
+        graph.update((prop, frozenset())
+                     for prop in functools.reduce(set.union,
+                                                  map(set, graph.values()),
+                                                  set()) - set(graph.keys()))
+        # DFS searching for leaves
+        while True:
+            leaves = frozenset(prop for prop, deps in graph.items()
+                               if not deps)
+            if not leaves:
+                break
+            # remove leaves from graph
+            graph = dict((prop, (deps - leaves))
+                         for prop, deps in graph.items()
+                         if prop not in leaves)
+
+        # here remaining vertex are in a loop (over-approximated)
+        if graph:
+            raise ValueError("In class %s found a loop among logical OPs: %s"\
+                                 % (_mod_cls, ", ".join(graph.keys())))
+
+        # here the graph is a DAG, the affected OPs are collected in
+        # topological order (reversed DFS post-order), so that each
+        # logical OP comes after all the affected OPs it depends on
+        closure = {}
+        for prop in rdeps_map:
+            post_order = []
+            visited = set((prop,))
+            stack = [(prop, iter(rdeps_map[prop]))]
+            while stack:
+                node, children = stack[-1]
+                for child in children:
+                    if child not in visited:
+                        visited.add(child)
+                        stack.append((child, iter(rdeps_map.get(child, ()))))
+                        break
+                else:
+                    stack.pop()
+                    post_order.append(node)
+            post_order.pop()  # prop itself
+            post_order.reverse()
+            closure[prop] = tuple(post_order)
+
+        return (dict((prop, tuple(rdeps))
+                     for prop, rdeps in rdeps_map.items()),
+                closure)
+
     def get_getter(cls, prop_name,  # @NoSelf
                    user_getter=None, getter_takes_name=False):
         """This implementation returns the PROP_NAME value if there
@@ -690,6 +813,32 @@ class ObservablePropertyMeta (PropertyMeta):
                                              user_getter, getter_takes_name)
 
         def _setter(self, val):
+            if not self._is_observed():
+                # nobody is listening: dependencies and notifications
+                # can be skipped. The old value is still needed for
+                # concrete properties, to release replaced wrappers.
+                new = type(self).create_value(prop_name, val, self)
+                if has_prop_variable:
+                    old = _inner_getter(self)
+                    _inner_setter(self, new)
+                    if type(self).check_value_change(old, new):
+                        self._reset_property_notification(prop_name, old)
+                else:
+                    _inner_setter(self, new)
+                self._invalidate_logical_cache(prop_name)
+                return
+
+            if self._in_batch():
+                # notifications are sent when the batch ends
+                old = _inner_getter(self)
+                new = type(self).create_value(prop_name, val, self)
+                self._record_property_value_change(prop_name, old, val)
+                _inner_setter(self, new)
+                self._invalidate_logical_cache(prop_name)
+                if type(self).check_value_change(old, new):
+                    self._reset_property_notification(prop_name, old)
+                return
+
             curr_frame = len(self._notify_stack)
             if prop_name not in self._notify_stack:
                 self._notify_stack.append(prop_name)
@@ -705,11 +854,13 @@ class ObservablePropertyMeta (PropertyMeta):
 
             # this is the unique place where the value is set:
             _inner_setter(self, new)
+            self._invalidate_logical_cache(prop_name)
 
             if type(self).check_value_change(old, new):
                 self._reset_property_notification(prop_name, old)
 
-            self.notify_property_value_change(prop_name, old, val)
+            if self._has_observer(prop_name):
+                self.notify_property_value_change(prop_name, old, val)
 
             # to notify dependencies
             self.__after_property_value_change__(prop_name, olds)
@@ -752,6 +903,10 @@ try:
     from sqlobject import Col  # @UnresolvedImport
     from sqlobject.inheritance import InheritableSQLObject  # @UnresolvedImport
     from sqlobject.events import listen, RowUpdateSignal  # @UnresolvedImport
+    try:
+        from sqlobject.events import RowUpdatedSignal  # @UnresolvedImport
+    except ImportError:
+        RowUpdatedSignal = None
 
     class ObservablePropertyMetaSQL (InheritableSQLObject.__metaclass__,
                                      ObservablePropertyMeta):
@@ -764,6 +919,8 @@ try:
             ObservablePropertyMeta.__init__(cls, name, bases, _dict)
 
             listen(cls.update_listener, cls, RowUpdateSignal)
+            if RowUpdatedSignal is not None:
+                listen(cls.updated_listener, cls, RowUpdatedSignal)
 
         def __create_conc_prop_accessors__(cls,  # @NoSelf
                                            prop_name, default_val):
@@ -784,11 +941,20 @@ try:
 
                     # to track dependencies
                     olds = instance.__before_property_value_change__(k)
+                    instance._invalidate_logical_cache(k)
                     # to notify the property observer
                     instance.notify_property_value_change(k, _old, _new)
                     # to notify dependencies
                     instance.__after_property_value_change__(k, olds)
 
+        def updated_listener(cls, instance, post_funcs):  # @NoSelf
+            # update_listener is called before columns are updated, so
+            # logical values cached meanwhile may be stale
+            conc_pnames, _ = type(cls).__get_observables_sets__(cls)
+            for k in cls.sqlmeta.columns:
+                if k in conc_pnames:
+                    instance._invalidate_logical_cache(k)
+
 except:
     pass
 
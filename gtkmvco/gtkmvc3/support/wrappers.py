@@ -63,34 +63,57 @@ class ObsWrapperBase (object):
                                          args, kwargs)
 
 
+# ----------------------------------------------------------------------
+def _get_wrapper(name):
+    """Returns a method calling the wrapped object's method with the
+    given name, between the before and after notifications"""
+    def _wrapper_fun(self, *args, **kwargs):
+        self._notify_method_before(self._obj, name, args, kwargs)
+        res = getattr(self._obj, name)(*args, **kwargs)
+        self._notify_method_after(self._obj, name, res, args, kwargs)
+        return res
+    _wrapper_fun.__name__ = name
+    return _wrapper_fun
+
+
+def _get_delegate(name):
+    """Returns a method simply calling the wrapped object's method
+    with the given name"""
+    def _delegate_fun(self, *args):
+        return getattr(self._obj, name)(*args)
+    _delegate_fun.__name__ = name
+    return _delegate_fun
+
+
 # ----------------------------------------------------------------------
 class ObsWrapper (ObsWrapperBase):
     """
     Base class for wrappers, like user-classes and sequences.
     """
 
+    # (class, method names) --> derived class wrapping those methods
+    __derived_classes = {}
+
     def __init__(self, obj, method_names):
         ObsWrapperBase.__init__(self)
 
         self._obj = obj
         self.__doc__ = obj.__doc__
 
-        # Creates a derived class which is a singleton which self is
-        # going to be an instance of. All method_names are then
-        # wrapped within it.
+        # self becomes instance of a derived class in which all
+        # method_names are wrapped. The derived class is created only
+        # once for each set of names, and then shared among all
+        # instances.
         # See http://stackoverflow.com/questions/1022499/\
         #emulating-membership-test-in-python-delegating-\
         #contains-to-contained-object
-        d = dict((name, self.__get_wrapper(name)) for name in method_names)
-        self.__class__ = type(self.__class__.__name__, (self.__class__,), d)
-
-    def __get_wrapper(self, name):
-        def _wrapper_fun(self, *args, **kwargs):
-            self._notify_method_before(self._obj, name, args, kwargs)
-            res = getattr(self._obj, name)(*args, **kwargs)
-            self._notify_method_after(self._obj, name, res, args, kwargs)
-            return res
-        return _wrapper_fun
+        key = (self.__class__, tuple(method_names))
+        cls = ObsWrapper.__derived_classes.get(key)
+        if cls is None:
+            d = dict((name, _get_wrapper(name)) for name in method_names)
+            cls = type(self.__class__.__name__, (self.__class__,), d)
+            ObsWrapper.__derived_classes[key] = cls
+        self.__class__ = cls
 
     # For all fall backs
     def __getattr__(self, name):
@@ -108,11 +131,19 @@ class ObsSeqWrapper (ObsWrapper):
     def __init__(self, obj, method_names):
         ObsWrapper.__init__(self, obj, method_names)
 
-        for _m in "lt le eq ne gt ge len iter".split():
-            meth = "__%s__" % _m
-            assert hasattr(self._obj, meth), "Not found method %s in %s" \
-                % (meth, str(type(self._obj)))
-            setattr(self.__class__, meth, getattr(self._obj, meth))
+    # these are delegated to the wrapped object
+    __lt__ = _get_delegate("__lt__")
+    __le__ = _get_delegate("__le__")
+    __eq__ = _get_delegate("__eq__")
+    __ne__ = _get_delegate("__ne__")
+    __gt__ = _get_delegate("__gt__")
+    __ge__ = _get_delegate("__ge__")
+    __len__ = _get_delegate("__len__")
+    __iter__ = _get_delegate("__iter__")
+
+    # instances are hashed by identity, as they were before __eq__
+    # was delegated
+    __hash__ = ObsWrapper.__hash__
 
     def __setitem__(self, key, val):
         self._notify_method_before(self._obj, "__setitem__", (key,val), {})
@@ -145,11 +176,8 @@ class ObsListWrapper (ObsSeqWrapper):
                    "pop", "remove", "reverse", "sort")
         ObsSeqWrapper.__init__(self, l, methods)
 
-        for _m in "add mul".split():
-            meth = "__%s__" % _m
-            assert hasattr(self._obj, meth), "Not found method %s in %s" % \
-                (meth, str(type(self._obj)))
-            setattr(self.__class__, meth, getattr(self._obj, meth))
+    __add__ = _get_delegate("__add__")
+    __mul__ = _get_delegate("__mul__")
 
     def __radd__(self, other):
         return other.__add__(self._obj)
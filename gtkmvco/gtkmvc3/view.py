@@ -25,6 +25,8 @@
 #  or to <roboogle@gmail.com>.
 
 import itertools
+import os.path
+import xml.etree.ElementTree as ElementTree
 
 from gtkmvc3.support.exceptions import ViewError
 
@@ -32,14 +34,80 @@ from gi.repository import Gtk
 from gi.repository import GLib
 # ----------------------------------------------------------------------
 
+# GtkBuilder files whose dependencies among top-level objects have been
+# calculated: path --> (mtime, map), see _get_builder_objects
+_builder_files = {}
+
+
+def _get_builder_objects(path, names):
+    """Returns the list of ids to be passed to
+    Gtk.Builder.add_objects_from_file to build the objects named in
+    the given sequence, and all the top-level objects they refer to
+    (e.g. adjustments and tree models).
+
+    As object references are not known without the types of the
+    properties, any property value, signal object and widget name which
+    is the id of an object is taken as a reference. The dependencies
+    of a file are calculated once, and then cached until the file is
+    modified."""
+    mtime = os.path.getmtime(path)
+    cached = _builder_files.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, _calculate_builder_deps(path))
+        _builder_files[path] = cached
+    owners, deps = cached[1]
+
+    res = list(names)
+    to_visit = [owners[name] for name in names if name in owners]
+    visited = set(res)
+    while to_visit:
+        top = to_visit.pop()
+        if top not in visited:
+            visited.add(top)
+            res.append(top)
+        to_visit.extend(dep for dep in deps[top] if dep not in visited)
+    return res
+
+
+def _calculate_builder_deps(path):
+    """Parses the given GtkBuilder file, and returns a pair of maps.
+    The first associates the id of each object to the id of the
+    top-level object containing it. The second associates the id of
+    each top-level object to the set of ids of the top-level objects
+    it refers to."""
+    root = ElementTree.parse(path).getroot()
+
+    owners = {}
+    refs = {}
+    for top in root.findall("object"):
+        top_id = top.get("id")
+        _refs = set()
+        for elem in top.iter():
+            if elem.tag == "object" and elem.get("id") is not None:
+                owners[elem.get("id")] = top_id
+            elif elem.tag == "property" and elem.text:
+                _refs.add(elem.text.strip())
+            elif elem.tag == "signal" and elem.get("object"):
+                _refs.add(elem.get("object"))
+            elif elem.tag == "widget" and elem.get("name"):
+                _refs.add(elem.get("name"))
+        refs[top_id] = _refs
+
+    deps = dict((top_id, set(owners[ref] for ref in _refs
+                             if ref in owners and owners[ref] != top_id))
+                for top_id, _refs in refs.items())
+    return owners, deps
+
 
 class View (object):
     top=None
     builder=None
+    builder_lazy=False
 
     def __init__(self, top=None,
                  parent=None,
-                 builder=None):
+                 builder=None,
+                 builder_lazy=None):
         """
         Only the first three may be given as positional arguments. If an
         argument is empty a class attribute of the same name is used. This
@@ -59,6 +127,15 @@ class View (object):
         variant with class attributes, or all instances of this view will share
         one set of widgets.
 
+        *builder_lazy* if True and *builder* is a path, only the widgets
+        in *top* are created, along with all the objects they refer to
+        (e.g. adjustments and tree models). Other widgets in the file
+        are not available in the view. If None, the class attribute of
+        the same name is used.
+
+        .. versionadded:: 1.1.0
+           The *builder_lazy* parameter.
+
         .. deprecated:: 1.99.1
            In future versions the functionality will be split into the new
            class :class:`ManualView` and its child :class:`BuilderView`.
@@ -67,6 +144,10 @@ class View (object):
         self.autoWidgets = {}
         self.__autoWidgets_calculated = False
 
+        # index of widget names, calculated when needed. This is a
+        # pair (names, suffixes), see __get_names_index
+        self.__names_index = None
+
         self.glade_xmlWidgets = []
 
         _top = top if top else self.top
@@ -88,7 +169,13 @@ class View (object):
                 self._builder = _builder
             else:
                 self._builder = Gtk.Builder()
-                self._builder.add_from_file(_builder)
+                _lazy = (self.builder_lazy if builder_lazy is None
+                         else builder_lazy)
+                if _lazy and _top is not None:
+                    self._builder.add_objects_from_file(
+                        _builder, _get_builder_objects(_builder, wids))
+                else:
+                    self._builder.add_from_file(_builder)
         else:
             self._builder = None # no gtk builder
 
@@ -146,6 +233,7 @@ class View (object):
         If no top widget is known, this sets it.
         """
         self.manualWidgets[key] = wid
+        self.__names_index = None
         if self.m_topWidget is None:
             self.m_topWidget = wid
 
@@ -275,12 +363,44 @@ class View (object):
            In case of name conflicts the result contains duplicates, but only
            the manually added widget is accessible via :meth:`__getitem__`.
         """
-        # precalculates if needed
-        self.__extract_autoWidgets()
-
-        for i in itertools.chain(self.manualWidgets, self.autoWidgets):
+        for i in self.__get_names_index()[0]:
             yield i
 
+    def get_names_ending_with(self, suffix):
+        """
+        Return a tuple of the names yielded by :meth:`__iter__` which
+        end with *suffix*, ignoring case.
+
+        This does not iterate over the widgets: names are indexed
+        once, and the index is rebuilt only after :meth:`__setitem__`
+        is called.
+
+        .. versionadded:: 1.1.0
+        """
+        return self.__get_names_index()[1].get(suffix.lower(), ())
+
+    def __get_names_index(self):
+        """Returns the pair (names, suffixes) where names is the
+        tuple of widget names in iteration order, and suffixes maps
+        each suffix of the lowercase names to the tuple of names
+        ending with it. The index is calculated if needed."""
+        if self.__names_index is None:
+            # precalculates if needed
+            self.__extract_autoWidgets()
+
+            names = tuple(itertools.chain(self.manualWidgets,
+                                          self.autoWidgets))
+            suffixes = {}
+            for name in names:
+                lname = name.lower()
+                for idx in range(len(lname)):
+                    suffixes.setdefault(lname[idx:], []).append(name)
+
+            self.__names_index = (names,
+                                  dict((suffix, tuple(_names))
+                                       for suffix, _names in suffixes.items()))
+        return self.__names_index
+
     def __extract_autoWidgets(self):
         """Extract autoWidgets map if needed, out of the glade
         specifications and gtk builder"""
@@ -301,4 +421,4 @@ class View (object):
 
                 self.autoWidgets[name] = wid
 
-        self.__autowidgets_calculated = True
+        self.__autoWidgets_calculated = True
@@ -0,0 +1,30 @@
+"""Measures adapters connected per second, by number of model properties."""
+
+import logging
+import timeit
+
+import _importer
+import gtkmvc3
+from gtkmvc3.adapters import Adapter
+
+logging.getLogger("gtkmvc3").setLevel(logging.ERROR)
+
+
+def make_model_class(n):
+    props = dict(("prop%d" % i, 0) for i in range(n))
+    props["__observables__"] = sorted(props)
+    return type(gtkmvc3.Model)("MyModel%d" % n, (gtkmvc3.Model,), props)
+
+
+def connect(model_class, N=1000):
+    m = model_class()
+    for i in range(N):
+        Adapter(m, "prop%d" % (i % 10))
+
+
+if __name__ == "__main__":
+    for n in (10, 100, 1000):
+        cls = make_model_class(n)
+        t = timeit.Timer(lambda: connect(cls))
+        print("%4d properties %8d adapters/second" % (
+              n, 1000 / min(t.repeat(3, 1))))
@@ -0,0 +1,110 @@
+"""
+Test for the policies committing widget changes into the model.
+"""
+
+import unittest
+
+from _importer import refresh_gui
+
+import gtkmvc3
+from gtkmvc3.adapters import Adapter
+
+
+class Model (gtkmvc3.Model):
+    val = 0
+    __observables__ = ("val",)
+
+
+class Observer (gtkmvc3.Observer):
+    def __init__(self, model):
+        gtkmvc3.Observer.__init__(self, model)
+        self.values = []
+
+    @gtkmvc3.Observer.observe("val", assign=True)
+    def val_assign(self, model, name, info):
+        self.values.append(info.new)
+
+
+class Widget (object):
+    """Emulates an entry, handlers are called by emit"""
+    def __init__(self):
+        self.text = ""
+        self.handlers = {}
+
+    def connect(self, signal, handler):
+        self.handlers[signal] = handler
+
+    def emit(self, signal, *args):
+        self.handlers[signal](self, *args)
+
+    def get(self):
+        return self.text
+
+    def set(self, value):
+        self.text = str(value)
+
+    def type(self, text):
+        for c in text:
+            self.text += c
+            self.emit("changed")
+
+
+class Commit (unittest.TestCase):
+    def setUp(self):
+        self.m = Model()
+        self.o = Observer(self.m)
+        self.w = Widget()
+        self.errors = []
+
+    def connect(self, commit):
+        ad = Adapter(self.m, "val", value_error=self.on_error)
+        ad.connect_widget(self.w, Widget.get, Widget.set, "changed",
+                          commit=commit)
+        self.w.text = ""
+        return ad
+
+    def on_error(self, adapter, prop_name, value):
+        self.errors.append(value)
+
+    def test_immediate(self):
+        self.connect("immediate")
+        self.w.type("123")
+        self.assertEqual(self.o.values, [1, 12, 123])
+
+    def test_debounce(self):
+        self.connect(20)
+        self.w.type("123")
+        self.assertEqual(self.o.values, [])
+        refresh_gui(0.1)
+        refresh_gui()
+        self.assertEqual(self.o.values, [123])
+
+    def test_focus_out(self):
+        self.connect("focus-out")
+        self.w.type("12")
+        refresh_gui()
+        self.assertEqual(self.o.values, [])
+        self.w.emit("focus-out-event", None)
+        self.assertEqual(self.o.values, [12])
+        self.w.emit("focus-out-event", None)
+        self.assertEqual(self.o.values, [12])
+        self.w.type("3")
+        self.w.emit("activate")
+        self.assertEqual(self.o.values, [12, 123])
+
+    def test_validation_once(self):
+        self.connect("focus-out")
+        self.w.type("1x2")
+        self.w.emit("activate")
+        self.assertEqual(self.errors, ["1x2"])
+        self.assertEqual(self.o.values, [])
+
+    def test_invalid_policy(self):
+        ad = Adapter(self.m, "val")
+        self.assertRaises(ValueError, ad.connect_widget, self.w,
+                          Widget.get, Widget.set, "changed",
+                          commit="never")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Test for adapters deferring and coalescing widget updates.
+"""
+
+import unittest
+
+from _importer import refresh_gui
+
+import gtkmvc3
+from gtkmvc3.adapters import Adapter
+
+
+class Model (gtkmvc3.Model):
+    val = 0
+    __observables__ = ("val",)
+
+
+class Widget (object):
+    """Records the values written by adapters"""
+    def __init__(self):
+        self.value = None
+        self.writes = []
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+        self.writes.append(value)
+
+
+class RateLimit (unittest.TestCase):
+    def setUp(self):
+        self.m = Model()
+        self.w = Widget()
+
+    def connect(self, rate_limit):
+        ad = Adapter(self.m, "val", rate_limit=rate_limit)
+        ad.connect_widget(self.w, Widget.get, Widget.set, signal="")
+        return ad
+
+    def test_immediate(self):
+        self.connect(None)
+        for i in range(1, 4):
+            self.m.val = i
+        self.assertEqual(self.w.writes, [0, 1, 2, 3])
+
+    def test_coalesce(self):
+        self.connect(0)
+        for i in range(1, 4):
+            self.m.val = i
+        self.assertEqual(self.w.writes, [0])
+        refresh_gui()
+        self.assertEqual(self.w.writes, [0, 3])
+        self.m.val = 4
+        refresh_gui()
+        self.assertEqual(self.w.writes, [0, 3, 4])
+
+    def test_rate_limit(self):
+        self.connect(10)
+        for i in range(1, 4):
+            self.m.val = i
+        refresh_gui(0.05)
+        refresh_gui()
+        self.assertEqual(self.w.writes, [0, 3])
+
+    def test_from_widget(self):
+        # values written by the adapter itself are not written back
+        ad = self.connect(0)
+        self.w.value = 5
+        ad.update_model()
+        self.assertEqual(self.m.val, 5)
+        refresh_gui()
+        self.assertEqual(self.w.writes, [0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+Test for the registry of default adapters.
+"""
+
+import unittest
+
+import _importer
+from gtkmvc3.adapters.default import AdapterRegistry, WIDGET, FLAVOUR
+
+
+class Base (object): pass
+class Derived (Base): pass
+class Other (object): pass
+
+BASE = (Base, "changed", None, None, str, None)
+BASE_FLAVOUR = (Base, "changed", None, None, int, "number")
+DERIVED = (Derived, "activate", None, None, str, None)
+
+
+class Registry (unittest.TestCase):
+    def setUp(self):
+        self.r = AdapterRegistry([BASE, BASE_FLAVOUR])
+
+    def test_search(self):
+        self.assertTrue(self.r.search(Base()) is BASE)
+        self.assertTrue(self.r.search(Derived()) is BASE)
+        self.assertTrue(self.r.search(Derived(), "number") is BASE_FLAVOUR)
+        self.assertRaises(TypeError, self.r.search, Other())
+        self.assertRaises(TypeError, self.r.search, Base(), "missing")
+
+    def test_stats(self):
+        self.r.search(Base())
+        self.r.search(Base())
+        self.assertRaises(TypeError, self.r.search, Other())
+        self.assertRaises(TypeError, self.r.search, Other())
+        self.assertEqual(self.r.get_stats(), {'hits': 2, 'misses': 2,
+                                              'size': 2, 'cached': 2})
+
+    def test_add_after_search(self):
+        self.assertTrue(self.r.search(Derived()) is BASE)
+        version = self.r.get_version()
+        self.r.add(*DERIVED)
+        self.assertNotEqual(self.r.get_version(), version)
+        self.assertEqual(self.r.search(Derived()), DERIVED)
+        self.assertTrue(self.r.search(Base()) is BASE)
+        self.assertTrue(self.r.remove(Derived))
+        self.assertTrue(self.r.search(Derived()) is BASE)
+        self.assertFalse(self.r.remove(Derived))
+
+    def test_override(self):
+        new = (Base, "changed", None, None, float, None)
+        self.r.search(Base())
+        self.r.add(*new)
+        self.assertEqual(self.r.search(Base()), new)
+        self.r.remove(Base)
+        self.assertTrue(self.r.search(Base()) is BASE)
+
+    def test_direct_modification(self):
+        self.r.search(Derived())
+        entries = self.r.get_entries()
+        entries.insert(0, DERIVED)
+        self.assertTrue(self.r.search(Derived()) is DERIVED)
+        entries[0:len(entries)] = [BASE]
+        self.assertTrue(self.r.search(Derived()) is BASE)
+        self.assertEqual(self.r.get_stats()['size'], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
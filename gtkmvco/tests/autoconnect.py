@@ -26,6 +26,13 @@ class Controller(Super):
     def on_main_window__delete_event(self, widget, event):
         self.calls.append(widget)
 
+class Instance(Super):
+    def __init__(self):
+        # stored in the instance, not in the class
+        self.on_main_window__delete_event = \
+            lambda widget, event: self.calls.append(widget)
+        Super.__init__(self, handlers="class")
+
 class AutoConnect(unittest.TestCase):
     def testDefault(self):
         c = Super()
@@ -51,6 +58,11 @@ class AutoConnect(unittest.TestCase):
         # Didn't find a better way.
         w.emit('delete-event', Gdk.Event())
         self.assertEqual([w], c.calls)
+    def testInstance(self):
+        c = Instance()
+        w = c.view['main_window']
+        w.emit('delete-event', Gdk.Event())
+        self.assertEqual([w], c.calls)
 
 if __name__ == "__main__":
     unittest.main()
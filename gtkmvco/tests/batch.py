@@ -0,0 +1,120 @@
+"""
+Test for deferring notifications with Model.batch()
+"""
+
+import _importer
+from gtkmvc3 import Model, Observer
+
+import unittest
+
+
+class MyModel (Model):
+    a = 0
+    b = 0
+    lst = []
+    __observables__ = ("a", "b", "lst", "total")
+
+    def __init__(self):
+        Model.__init__(self)
+        self.evaluations = 0
+
+    @Model.getter(deps=["a", "b"])
+    def total(self):
+        self.evaluations += 1
+        return self.a + self.b
+
+
+class MyObserver (Observer):
+    def __init__(self, *models):
+        Observer.__init__(self)
+        self.notif = []
+        for m in models:
+            self.observe_model(m)
+
+    @Observer.observe("a", assign=True)
+    @Observer.observe("b", assign=True)
+    @Observer.observe("total", assign=True)
+    def assign(self, model, name, info):
+        self.notif.append((model, name, info.old, info.new))
+
+    @Observer.observe("lst", after=True)
+    def mutation(self, model, name, info):
+        self.notif.append((model, name, info.method_name))
+
+
+class BatchTest (unittest.TestCase):
+    def setUp(self):
+        self.m = MyModel()
+        self.o = MyObserver(self.m)
+
+    def test_merge(self):
+        with self.m.batch():
+            self.m.a = 1
+            self.m.b = 2
+            self.m.a = 3
+            self.assertEqual(self.o.notif, [])
+            self.assertEqual(self.m.total, 5)
+
+        m = self.m
+        self.assertEqual(self.o.notif, [(m, "a", 0, 3), (m, "total", 0, 5),
+                                        (m, "b", 0, 2)])
+
+    def test_logical_once(self):
+        with self.m.batch():
+            for i in range(10):
+                self.m.a = i
+                self.m.b = i
+        # once for the old value, once for the new one
+        self.assertEqual(self.m.evaluations, 2)
+
+    def test_unchanged(self):
+        with self.m.batch():
+            self.m.a = 1
+            self.m.a = 0
+        self.assertEqual(self.o.notif, [])
+
+    def test_nested(self):
+        with self.m.batch():
+            with self.m.batch():
+                self.m.a = 1
+            self.assertEqual(self.o.notif, [])
+            self.m.b = 1
+        self.assertEqual(len(self.o.notif), 3)
+
+    def test_several_models(self):
+        m2 = MyModel()
+        self.o.observe_model(m2)
+        with self.m.batch(), m2.batch():
+            self.m.a = 1
+            m2.a = 2
+            m2.a = 3
+        # the innermost batch ends first
+        self.assertEqual(self.o.notif, [(m2, "a", 0, 3),
+                                        (m2, "total", 0, 3),
+                                        (self.m, "a", 0, 1),
+                                        (self.m, "total", 0, 1)])
+
+    def test_mutations_not_deferred(self):
+        self.m.lst = []
+        with self.m.batch():
+            self.m.lst = [1]
+            self.m.lst.append(2)
+            self.assertEqual(self.o.notif, [(self.m, "lst", "append")])
+
+    def test_exception(self):
+        # assignments made before the exception are kept, and notified
+        # before it propagates
+        try:
+            with self.m.batch():
+                self.m.a = 1
+                raise RuntimeError
+        except RuntimeError:
+            self.assertEqual(self.o.notif[0], (self.m, "a", 0, 1))
+        self.assertEqual(self.m.a, 1)
+        self.assertFalse(self.m._in_batch())
+        self.m.b = 1
+        self.assertEqual(self.o.notif[-1], (self.m, "total", 1, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+"""Measures controllers opened per second on the same view class."""
+
+import logging
+import timeit
+
+import _importer
+from _importer import refresh_gui
+import gtkmvc3
+
+logging.getLogger("gtkmvc3").setLevel(logging.ERROR)
+
+
+class MyView (gtkmvc3.View):
+    builder = "adapters.ui"
+    top = "window3"
+
+
+class MyCtrl (gtkmvc3.Controller):
+    def on_button3_clicked(self, button): pass
+
+    def on_button3__clicked(self, button): pass
+
+    def on_window3__delete_event(self, window, event): pass
+
+    @property
+    def expensive(self):
+        return sum(range(10000))
+
+# a controller with many methods, like real ones
+for i in range(100):
+    setattr(MyCtrl, "method%d" % i, lambda self: None)
+
+
+def open_controllers(handlers, N=1000):
+    m = gtkmvc3.Model()
+    v = MyView()
+    for _ in range(N):
+        MyCtrl(m, v, handlers=handlers)
+    refresh_gui()
+
+
+if __name__ == "__main__":
+    for handlers in ("glade", "class"):
+        t = timeit.Timer(lambda: open_controllers(handlers))
+        print("%-5s %8d controllers/second" % (
+              handlers, 1000 / min(t.repeat(3, 1))))
@@ -0,0 +1,54 @@
+"""
+Test for views building only their top-level widgets out of a
+GtkBuilder file.
+"""
+
+import unittest
+
+import _importer
+import gtkmvc3
+from gtkmvc3 import view
+
+
+class LazyView (gtkmvc3.View):
+    builder = "adapters.ui"
+    top = "window3"
+    builder_lazy = True
+
+
+class BuilderObjects (unittest.TestCase):
+    def test_dependencies(self):
+        self.assertEqual(view._get_builder_objects("adapters.ui",
+                                                   ["window3"]),
+                         ["window3", "adjustment1"])
+        self.assertEqual(view._get_builder_objects("adapters.ui",
+                                                   ["window1"]),
+                         ["window1"])
+
+    def test_nested(self):
+        # vbox3 is inside window3, which refers adjustment1
+        self.assertEqual(view._get_builder_objects("adapters.ui",
+                                                   ["vbox3"]),
+                         ["vbox3", "window3", "adjustment1"])
+
+    def test_cached(self):
+        view._get_builder_objects("adapters.ui", ["window3"])
+        cached = view._builder_files["adapters.ui"]
+        view._get_builder_objects("adapters.ui", ["window4"])
+        self.assertTrue(view._builder_files["adapters.ui"] is cached)
+
+
+class Lazy (unittest.TestCase):
+    def test_only_top(self):
+        v = LazyView()
+        self.assertTrue(v["button3"] is not None)
+        self.assertTrue(v["adjustment1"] is not None)
+        self.assertRaises(KeyError, lambda: v["window4"])
+
+    def test_not_lazy(self):
+        v = LazyView(builder_lazy=False)
+        self.assertTrue(v["window4"] is not None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+"""Measures assignments per second to a property many others depend on."""
+
+import logging
+import timeit
+
+import _importer
+from gtkmvc3 import Model, Observer
+
+logging.getLogger("gtkmvc3").setLevel(logging.ERROR)
+
+
+def _make_getter(dep):
+    return lambda self: getattr(self, dep) + 1
+
+
+def make_model(name, deps_of):
+    """Builds a model class with concrete property 'conc' and logical
+    properties log0..logN-1, where log<i> depends on deps_of(i)"""
+    n = len(deps_of)
+    attrs = {"conc": 0,
+             "__observables__": ["conc"] + ["log%d" % i for i in range(n)]}
+    for i, dep in enumerate(deps_of):
+        getter = _make_getter(dep)
+        getter.__name__ = "log%d" % i
+        attrs[getter.__name__] = Model.getter(deps=[dep])(getter)
+    return type(Model)(name, (Model,), attrs)
+
+
+# log0 <- conc, log1 <- log0, ..., log49 <- log48
+Chain = make_model("Chain", ["conc"] + ["log%d" % i for i in range(49)])
+# log0..log499 <- conc
+FanOut = make_model("FanOut", ["conc"] * 500)
+
+
+class Obs (Observer):
+    @Observer.observe("log*", assign=True)
+    def notify(self, model, name, info): pass
+
+
+def measure(model_class, observed, N):
+    m = model_class()
+    if observed:
+        Obs(m)
+    t = timeit.Timer(lambda: setattr(m, "conc", m.conc + 1))
+    return N / min(t.repeat(3, N))
+
+
+if __name__ == "__main__":
+    for cls in (Chain, FanOut):
+        for observed in (False, True):
+            print("%-6s %-10s %10d assignments/second" % (
+                cls.__name__, observed and "observed" or "unobserved",
+                measure(cls, observed, observed and 200 or 20000)))
@@ -0,0 +1,97 @@
+"""
+Test for logical properties whose values are cached, and recalculated
+only when any of their dependencies change.
+"""
+
+import _importer
+from gtkmvc3 import Model, Observer
+
+import unittest
+
+
+class MyModel (Model):
+    a = 1
+    b = 2
+    lst = []
+    __observables__ = ("a", "b", "lst", "total", "double", "size")
+
+    def __init__(self):
+        Model.__init__(self)
+        self.calls = {"total": 0, "double": 0, "size": 0}
+        self.lst = []
+
+    @Model.getter(deps=["a", "b"], cache=True)
+    def total(self):
+        self.calls["total"] += 1
+        return self.a + self.b
+
+    @Model.getter(deps=["total"], cache=True)
+    def double(self):
+        self.calls["double"] += 1
+        return self.total * 2
+
+    @Model.getter(deps=["lst"], cache=True)
+    def size(self):
+        self.calls["size"] += 1
+        return len(self.lst)
+
+
+class TotalObserver (Observer):
+    def __init__(self, model=None):
+        Observer.__init__(self, model)
+        self.notif = []
+
+    @Observer.observe("double", assign=True)
+    def double_assign(self, model, name, info):
+        self.notif.append((info.old, info.new))
+
+
+class CachedLogicalPropsTest (unittest.TestCase):
+    def setUp(self):
+        self.m = MyModel()
+
+    def test_cached(self):
+        for _ in range(3):
+            self.assertEqual(self.m.total, 3)
+            self.assertEqual(self.m.double, 6)
+        self.assertEqual(self.m.calls["total"], 1)
+        self.assertEqual(self.m.calls["double"], 1)
+
+    def test_invalidated(self):
+        self.assertEqual(self.m.double, 6)
+        self.m.a = 10
+        self.assertEqual(self.m.double, 24)
+        self.assertEqual(self.m.double, 24)
+        self.assertEqual(self.m.calls["total"], 2)
+        self.assertEqual(self.m.calls["double"], 2)
+
+    def test_container_mutation(self):
+        self.assertEqual(self.m.size, 0)
+        self.m.lst.append(1)
+        self.assertEqual(self.m.size, 1)
+        self.assertEqual(self.m.size, 1)
+        self.assertEqual(self.m.calls["size"], 2)
+
+    def test_notifications(self):
+        o = TotalObserver(self.m)
+        self.m.b = 5
+        self.assertEqual(o.notif, [(6, 12)])
+
+    def test_batch(self):
+        o = TotalObserver(self.m)
+        with self.m.batch():
+            self.m.a = 2
+            self.assertEqual(self.m.double, 8)
+            self.m.b = 3
+        self.assertEqual(o.notif, [(6, 10)])
+        self.assertEqual(self.m.double, 10)
+
+    def test_instances(self):
+        m2 = MyModel()
+        m2.a = 5
+        self.assertEqual(self.m.total, 3)
+        self.assertEqual(m2.total, 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -154,6 +154,30 @@ class BranchMultiLevel (Model):
     pass
 
 
+class UnbalancedDiamond (Model):
+    # log3 depends on conc and on log2, which is reachable from conc
+    # only through log1. log3 must be notified after log2.
+    # ======================
+    #   conc <-- log1 <-- log2
+    #     ^                 ^
+    #     |                 |
+    #     +------ log3 -----+
+    # ======================
+    conc = 0
+
+    __observables__ = "conc log1 log2 log3".split()
+
+    @Model.getter(deps=["conc"])
+    def log1(self): return self.conc+1
+
+    @Model.getter(deps=["log1"])
+    def log2(self): return self.log1+1
+
+    @Model.getter(deps=["conc", "log2"])
+    def log3(self): return self.conc+self.log2
+    pass
+
+
 class LinearSingleLevelOldStyle (Model):
     # basic, single level linear dependency
     conc = 0
@@ -375,6 +399,15 @@ class LogicalPropsDeps (unittest.TestCase):
         # (*) diamond is handled
         return
 
+    def test_diamond_topological_order(self):
+        m = self.__model_factory(UnbalancedDiamond)
+        m.conc += 1
+
+        for o in (self.o1, self.o2):
+            self.assertEqual(o.rec, ["conc", "log1", "log2", "log3"])
+            pass
+        return
+
     def test_loop_detected(self):
         self.assertRaises(ValueError, InvalidLoop)
         return
@@ -0,0 +1,30 @@
+"""Measures instances per second of a model with logical properties."""
+
+import logging
+import timeit
+
+import _importer
+from gtkmvc3 import Model
+
+logging.getLogger("gtkmvc3").setLevel(logging.ERROR)
+
+
+class Row (Model):
+    name = ""
+    price = 0.0
+    amount = 0
+
+    __observables__ = ("name", "price", "amount", "total", "label")
+
+    @Model.getter(deps=["price", "amount"])
+    def total(self): return self.price * self.amount
+
+    @Model.getter(deps=["name", "total"])
+    def label(self): return "%s: %.2f" % (self.name, self.total)
+
+
+if __name__ == "__main__":
+    N = 10000
+    t = timeit.Timer("Row()", "from __main__ import Row")
+    # ~18700 when dependencies were calculated per instance, ~51000 now
+    print("%d instances/second" % (N / min(t.repeat(3, N))))
@@ -0,0 +1,116 @@
+"""
+Test for the per-class caching of the notifications resolved when
+registering observers.
+"""
+
+import types
+
+import _importer
+from gtkmvc3 import Model, Observer
+from gtkmvc3 import model as model_module
+
+import unittest
+
+
+class MyModel (Model):
+    a = 0
+    b = 0
+    lst = []
+    __observables__ = ("a", "b", "lst")
+
+
+class MyObserver (Observer):
+    def __init__(self, model=None):
+        Observer.__init__(self, model)
+        self.notif = []
+
+    @Observer.observe("a", assign=True)
+    def a_assign(self, model, name, info):
+        self.notif.append((name, info.new))
+
+    @Observer.observe("l*", before=True, after=True)
+    def lst_mutation(self, model, name, info):
+        self.notif.append((name, info.method_name))
+
+    def property_b_value_change(self, model, old, new):
+        self.notif.append(("b", new))
+
+
+class PerInstance (Observer):
+    """Chooses the observed property per instance"""
+    def __init__(self, prop_name, model):
+        self.prop_name = prop_name
+        self.notif = []
+        Observer.__init__(self, model)
+
+    def get_observing_methods(self, prop_name):
+        if prop_name == self.prop_name:
+            return set((self.on_change,))
+        return set()
+
+    def get_observing_method_kwargs(self, prop_name, method):
+        return {'assign': True}
+
+    def on_change(self, model, name, info):
+        self.notif.append(name)
+
+
+class NotificationCacheTest (unittest.TestCase):
+    def setUp(self):
+        self.m = MyModel()
+
+    def test_shared(self):
+        o1 = MyObserver(self.m)
+        o2 = MyObserver(self.m)
+        self.assertIn(MyModel, model_module._resolved_notifications[MyObserver])
+
+        self.m.a = 1
+        self.m.b = 2
+        self.m.lst.append(3)
+        for o in (o1, o2):
+            self.assertEqual(o.notif, [("a", 1), ("b", 2),
+                                       ("lst", "append"), ("lst", "append")])
+
+        o1.relieve_model(self.m)
+        self.m.a = 4
+        self.assertEqual(len(o1.notif), 4)
+        self.assertEqual(o2.notif[-1], ("a", 4))
+
+    def test_dynamic(self):
+        o1 = MyObserver(self.m)
+        o2 = MyObserver()
+        self.assertFalse(o2.has_dynamic_notifications())
+        o2.observe(o2.a_assign, "b", assign=True)
+        self.assertTrue(o2.has_dynamic_notifications())
+        o2.observe_model(self.m)
+
+        self.m.b = 1
+        self.assertEqual(o1.notif, [("b", 1)])
+        self.assertEqual(sorted(o2.notif), [("b", 1), ("b", 1)])
+
+    def test_instance_magic(self):
+        o1 = MyObserver(self.m)
+        o2 = MyObserver()
+
+        def property_a_value_change(self, model, old, new):
+            self.notif.append(("magic", new))
+        o2.property_a_value_change = types.MethodType(
+            property_a_value_change, o2)
+        o2.observe_model(self.m)
+
+        self.m.a = 1
+        self.assertEqual(o1.notif, [("a", 1)])
+        self.assertEqual(sorted(o2.notif), [("a", 1), ("magic", 1)])
+
+    def test_overridden_methods(self):
+        o1 = PerInstance("a", self.m)
+        o2 = PerInstance("b", self.m)
+        self.m.a = 1
+        self.m.b = 1
+        self.assertEqual(o1.notif, ["a"])
+        self.assertEqual(o2.notif, ["b"])
+        self.assertNotIn(PerInstance, model_module._resolved_notifications)
+
+
+if __name__ == "__main__":
+    unittest.main()
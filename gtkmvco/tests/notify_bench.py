@@ -0,0 +1,56 @@
+"""Measures notifications per second to 1, 10 and 100 observers."""
+
+import logging
+import timeit
+
+import _importer
+from gtkmvc3 import Model, Observer, Signal
+
+logging.getLogger("gtkmvc3").setLevel(logging.ERROR)
+
+
+class MyModel (Model):
+    val = 0
+    lst = []
+    sgn = None
+    __observables__ = ("val", "lst", "sgn")
+
+    def __init__(self):
+        Model.__init__(self)
+        self.lst = []
+        self.sgn = Signal()
+
+
+class NewStyle (Observer):
+    @Observer.observe("val", assign=True)
+    @Observer.observe("lst", after=True)
+    @Observer.observe("sgn", signal=True)
+    def notify(self, model, name, info): pass
+
+
+class OldStyle (Observer):
+    def property_val_value_change(self, model, old, new): pass
+
+    def property_sgn_signal_emit(self, model, arg): pass
+
+
+def measure(observer_class, num_obs, stmt, N=2000):
+    m = MyModel()
+    observers = [observer_class(m) for _ in range(num_obs)]
+    t = timeit.Timer(lambda: stmt(m))
+    return N * num_obs / min(t.repeat(3, N))
+
+
+def assign(m): m.val += 1
+def mutate(m): m.lst.append(0); del m.lst[:]  # two notifications
+def emit(m): m.sgn.emit(0)
+
+
+if __name__ == "__main__":
+    for observer_class, kinds in ((NewStyle, (assign, mutate, emit)),
+                                  (OldStyle, (assign, emit))):
+        for stmt in kinds:
+            for num_obs in (1, 10, 100):
+                print("%-8s %-6s %3d observers %10d notifications/second" % (
+                      observer_class.__name__, stmt.__name__, num_obs,
+                      measure(observer_class, num_obs, stmt)))
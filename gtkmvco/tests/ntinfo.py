@@ -0,0 +1,114 @@
+"""
+Test for the content of NTInfo instances, which is built once for all
+the observers notified by the same event.
+"""
+
+import copy
+import pickle
+
+import _importer
+from gtkmvc3 import Model, Observer
+from gtkmvc3.observer import NTInfo
+
+import unittest
+
+
+class MyModel (Model):
+    val = 0
+    __observables__ = ("val",)
+
+
+class MyObserver (Observer):
+    def __init__(self, model, **kwargs):
+        Observer.__init__(self)
+        self.infos = []
+        self.observe(self.notify, "val", assign=True, **kwargs)
+        self.observe_model(model)
+
+    def notify(self, model, name, info):
+        self.infos.append(info)
+
+
+class NTInfoTest (unittest.TestCase):
+    def test_constructor(self):
+        info = NTInfo('assign', {'before': True, 'foo': 1},
+                      assign=True, model=None, prop_name="val")
+        self.assertEqual(info, {'assign': True, 'foo': 1,
+                                'model': None, 'prop_name': "val"})
+        self.assertEqual(info.foo, 1)
+        self.assertRaises(KeyError, NTInfo, 'signal',
+                          model=None, prop_name="val")
+
+    def test_shared_content(self):
+        m = MyModel()
+        o1 = MyObserver(m)
+        o2 = MyObserver(m, foo="bar")
+        m.val = 1
+
+        info1, = o1.infos
+        info2, = o2.infos
+        self.assertEqual(dict(info1), {'assign': True, 'model': m,
+                                       'prop_name': "val",
+                                       'old': 0, 'new': 1})
+        self.assertEqual(dict(info2), dict(info1, foo="bar"))
+        self.assertEqual(len(info2), 6)
+        self.assertTrue("foo" in info2)
+        self.assertFalse("foo" in info1)
+        self.assertEqual(info2.foo, "bar")
+        self.assertRaises(AttributeError, lambda: info1.foo)
+
+    def test_other_flags_hidden(self):
+        m = MyModel()
+        o = MyObserver(m, before=True, after=True, signal=True)
+        m.val = 1
+        info, = o.infos
+        self.assertEqual(sorted(info), ['assign', 'model', 'new', 'old',
+                                        'prop_name'])
+        self.assertFalse("before" in info)
+
+    def test_event_overrides_kwargs(self):
+        m = MyModel()
+        o = MyObserver(m, new="overridden")
+        m.val = 1
+        self.assertEqual(o.infos[0].new, 1)
+
+    def test_private_copies(self):
+        m = MyModel()
+        o1 = MyObserver(m)
+        o2 = MyObserver(m)
+        m.val = 1
+        info1, = o1.infos
+        info2, = o2.infos
+
+        info1['key'] = 20
+        info1['key'] += 1
+        del info1['old']
+        self.assertEqual(info1['key'], 21)
+        self.assertFalse("old" in info1)
+        self.assertFalse("key" in info2)
+        self.assertEqual(info2.old, 0)
+
+    def test_copy(self):
+        m = MyModel()
+        o = MyObserver(m, foo="bar")
+        m.val = 1
+        info, = o.infos
+        self.assertTrue(isinstance(info, dict))
+        for dup in (copy.copy(info), copy.deepcopy(info)):
+            self.assertTrue(isinstance(dup, NTInfo))
+            self.assertEqual(sorted(dup), sorted(info))
+            self.assertEqual(dup.foo, "bar")
+            self.assertEqual(dup.new, 1)
+        self.assertTrue(copy.copy(info).model is m)
+
+    def test_pickle(self):
+        info = NTInfo('assign', assign=True, model=None, prop_name="val",
+                      old=0, new=1)
+        dup = pickle.loads(pickle.dumps(info))
+        self.assertTrue(isinstance(dup, NTInfo))
+        self.assertEqual(dup, info)
+        self.assertEqual(dup.new, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
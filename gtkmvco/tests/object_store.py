@@ -0,0 +1,111 @@
+import unittest
+
+from gi.repository import Gtk
+
+from _importer import refresh_gui
+
+import gtkmvc3
+
+class Row(gtkmvc3.Model):
+    value = 0
+    __observables__ = ('value',)
+
+class Index(unittest.TestCase):
+    def setUp(self):
+        self.store = gtkmvc3.ObjectListStoreModel(int)
+        self.items = [Row() for i in range(5)]
+        for i, item in enumerate(self.items):
+            self.store.append([item, i])
+
+    def index(self, obj):
+        return self.store.get_path(self.store.find(obj)).get_indices()[0]
+
+    def testFind(self):
+        for i, item in enumerate(self.items):
+            self.assertEqual(i, self.index(item))
+        self.assertTrue(self.store.find(Row()) is None)
+
+    def testInsert(self):
+        item = Row()
+        self.store.insert(0, [item, -1])
+        self.assertEqual(0, self.index(item))
+        self.assertEqual(5, self.index(self.items[4]))
+
+    def testAppendThenSet(self):
+        item = Row()
+        iter = self.store.append()
+        self.store.set_value(iter, 0, item)
+        self.assertEqual(5, self.index(item))
+
+    def testRemove(self):
+        self.assertTrue(self.store.remove_object(self.items[1]))
+        self.assertFalse(self.store.remove_object(self.items[1]))
+        self.assertTrue(self.store.find(self.items[1]) is None)
+        self.assertEqual(1, self.index(self.items[2]))
+
+    def testReorder(self):
+        self.store.reorder([4, 3, 2, 1, 0])
+        for i, item in enumerate(self.items):
+            self.assertEqual(4 - i, self.index(item))
+
+    def testReplaced(self):
+        item = Row()
+        self.store.set_value(self.store.find(self.items[0]), 0, item)
+        self.assertTrue(self.store.find(self.items[0]) is None)
+        self.assertEqual(0, self.index(item))
+
+    def testRowSet(self):
+        item = Row()
+        self.store[self.store.find(self.items[3])][0] = item
+        self.assertTrue(self.store.find(self.items[3]) is None)
+        self.assertEqual(3, self.index(item))
+
+    def testRemovedBehindBack(self):
+        Gtk.ListStore.remove(self.store, self.store.get_iter((1,)))
+        self.assertTrue(self.store.find(self.items[1]) is None)
+        self.assertEqual(1, self.index(self.items[2]))
+        self.assertEqual(3, self.index(self.items[4]))
+
+    def testClear(self):
+        self.store.clear()
+        self.assertTrue(self.store.find(self.items[0]) is None)
+
+class Watch(unittest.TestCase):
+    def setUp(self):
+        self.store = gtkmvc3.ObjectListStoreModel()
+        self.items = [Row() for i in range(3)]
+        for item in self.items:
+            self.store.append([item])
+        self.changed = []
+        self.store.connect('row-changed',
+                           lambda tree, path, iter: self.changed.append(
+                               path.get_indices()[0]))
+
+    def testUpdate(self):
+        self.assertTrue(self.store.update(self.items[2]))
+        self.assertFalse(self.store.update(Row()))
+        self.assertEqual([2], self.changed)
+
+    def testWatchItems(self):
+        watcher = self.store.watch_items()
+        self.assertTrue(watcher is self.store.watch_items())
+        self.items[1].value = 1
+        self.assertEqual([1], self.changed)
+
+    def testWatchRemoved(self):
+        self.store.watch_items()
+        self.store.remove_object(self.items[0])
+        self.items[0].value = 1
+        self.items[2].value = 1
+        self.assertEqual([1], self.changed)
+        self.assertFalse(self.items[0]._is_observed())
+
+    def testWatchBatch(self):
+        self.store.watch_items(batch=True)
+        self.items[1].value = 1
+        self.items[1].value = 2
+        refresh_gui()
+        self.assertEqual([1], self.changed)
+
+if __name__ == "__main__":
+    unittest.main()
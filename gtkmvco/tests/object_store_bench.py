@@ -0,0 +1,32 @@
+"""Measures rows per second loaded into and removed from an object store."""
+
+import logging
+import timeit
+
+import _importer
+import gtkmvc3
+
+logging.getLogger("gtkmvc3").setLevel(logging.ERROR)
+
+
+class Row (gtkmvc3.Model):
+    value = 0
+    __observables__ = ("value",)
+
+
+def load_find_remove(items):
+    store = gtkmvc3.ObjectListStoreModel(int)
+    store.extend([item, i] for i, item in enumerate(items))
+    for item in items:
+        store.find(item)
+    # from the middle, where shifting positions costs the most
+    for item in items[len(items) // 2:] + items[:len(items) // 2]:
+        store.remove_object(item)
+
+
+if __name__ == "__main__":
+    # the rate should not drop as the number of rows grows
+    for n in (1000, 10000, 100000):
+        items = [Row() for _ in range(n)]
+        t = timeit.Timer(lambda: load_find_remove(items))
+        print("%6d rows %8d rows/second" % (n, n / min(t.repeat(3, 1))))
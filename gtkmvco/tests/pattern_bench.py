@@ -0,0 +1,31 @@
+"""Measures property names per second matched against many patterns."""
+
+import logging
+import timeit
+
+import _importer
+import gtkmvc3
+
+logging.getLogger("gtkmvc3").setLevel(logging.ERROR)
+
+
+class MyObserver (gtkmvc3.Observer):
+    pass
+
+# an observer with many patterns, like those of generated code
+for i in range(50):
+    setattr(MyObserver, "on_group%d" % i, gtkmvc3.Observer.observe(
+        "group%d_*" % i, assign=True)(lambda self, model, name, info: None))
+
+NAMES = ["group%d_item%d" % (i, j) for i in range(50) for j in range(20)]
+
+
+def match(o):
+    for name in NAMES:
+        o.get_observing_methods(name)
+
+
+if __name__ == "__main__":
+    o = MyObserver()
+    t = timeit.Timer(lambda: match(o))
+    print("%8d names/second" % (len(NAMES) / min(t.repeat(3, 1))))
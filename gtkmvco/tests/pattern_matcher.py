@@ -0,0 +1,64 @@
+"""
+Test for the compiled matcher of the patterns used by observers.
+"""
+
+import fnmatch
+import itertools
+import unittest
+
+import _importer
+from gtkmvc3 import Observer
+from gtkmvc3 import observer as observer_module
+
+
+PATTERNS = ("*", "item_*", "a*b*c", "x?y", "[abc]*", "[!a]*z", "*_[0-9]",
+            "a[*]b")
+
+
+class MyObserver (Observer):
+    @Observer.observe("item_*", assign=True)
+    def on_item(self, model, name, info): pass
+
+    @Observer.observe("*_[0-9]", assign=True)
+    def on_numbered(self, model, name, info): pass
+
+    @Observer.observe("item_1", assign=True)
+    def on_first(self, model, name, info): pass
+
+    def on_dyn(self, model, name, info): pass
+
+
+class MatcherTest (unittest.TestCase):
+    def test_like_fnmatch(self):
+        matcher = observer_module._get_matcher(PATTERNS)
+        for n in range(5):
+            for chars in itertools.product("abxyz_*1", repeat=n):
+                name = "".join(chars)
+                self.assertEqual(
+                    sorted(p for p in PATTERNS if fnmatch.fnmatch(name, p)),
+                    sorted(matcher(name)), name)
+
+    def test_shared(self):
+        self.assertIs(observer_module._get_matcher(PATTERNS),
+                      observer_module._get_matcher(reversed(PATTERNS)))
+
+    def test_observing_methods(self):
+        o = MyObserver()
+        self.assertEqual({o.on_item, o.on_numbered, o.on_first},
+                         o.get_observing_methods("item_1"))
+        self.assertEqual({o.on_item}, o.get_observing_methods("item_x"))
+        self.assertEqual({o.on_numbered}, o.get_observing_methods("a_2"))
+        self.assertEqual(set(), o.get_observing_methods("other"))
+
+    def test_dynamic(self):
+        o = MyObserver()
+        self.assertEqual(set(), o.get_observing_methods("dyn"))
+        o.observe(o.on_dyn, "d?n", assign=True)
+        self.assertEqual({o.on_dyn}, o.get_observing_methods("dyn"))
+        o.remove_observing_method(("dyn",), o.on_dyn)
+        self.assertEqual(set(), o.get_observing_methods("dyn"))
+        self.assertEqual({o.on_item}, o.get_observing_methods("item_x"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Test for the notifications kept when a property is given a value of a
+different instance, type or kind.
+"""
+
+import unittest
+
+import _importer
+from gtkmvc3 import Model, Observer
+from gtkmvc3.observable import Signal
+
+
+class MyModel (Model):
+    prop = []
+    __observables__ = ("prop",)
+
+
+class MyObserver (Observer):
+    def __init__(self, model=None):
+        Observer.__init__(self, model)
+        self.notif = []
+
+    @Observer.observe("prop", assign=True, before=True, signal=True)
+    def on_prop(self, model, name, info):
+        for _type in ("assign", "before", "signal"):
+            if info.get(_type):
+                self.notif.append(_type)
+
+    def on_after(self, model, name, info):
+        self.notif.append("after")
+
+
+class ResetTest (unittest.TestCase):
+    def setUp(self):
+        self.m = MyModel()
+        self.o = MyObserver(self.m)
+        self.resolved = 0
+        resolve = self.m._Model__resolve_observer_notification
+
+        def counting(*args):
+            self.resolved += 1
+            return resolve(*args)
+        self.m._Model__resolve_observer_notification = counting
+
+    def test_same_kind(self):
+        for i in range(3):
+            self.m.prop = [i]
+            self.m.prop.append(i)
+        self.m.prop = {}
+        self.m.prop[0] = 1
+        self.assertEqual(["assign", "before"] * 4, self.o.notif)
+        self.assertEqual(0, self.resolved)
+
+    def test_kinds(self):
+        self.m.prop = 1
+        self.m.prop = 2
+        self.m.prop = Signal()
+        self.m.prop.emit()
+        self.m.prop = [0]
+        self.m.prop.append(1)
+        self.assertEqual(["assign"] * 3 + ["signal"] + ["assign", "before"],
+                         self.o.notif)
+        self.assertEqual(0, self.resolved)
+
+    def test_wrapper_dropped(self):
+        lst = self.m.prop
+        self.m.prop = None
+        lst.append(0)
+        self.assertEqual(["assign"], self.o.notif)
+        self.assertFalse(self.m._has_observer("x"))
+
+    def test_dynamic(self):
+        # notifications added at runtime are found at the next reset
+        self.o.observe(self.o.on_after, "prop", after=True)
+        self.m.prop = 1
+        self.m.prop = [1]
+        self.m.prop.append(2)
+        self.assertEqual(["assign", "assign", "before", "after"],
+                         self.o.notif)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -18,5 +18,33 @@ class SpecialMethod(unittest.TestCase):
     def testLen(self): self.assertEqual(2, self.m.my_len())
     pass
 
+class SharedClass(unittest.TestCase):
+    def testSameClass(self):
+        m1, m2 = MyModel(), MyModel()
+        self.assertTrue(type(m1.mylist) is type(m2.mylist))
+        self.assertEqual([1, 2], list(m1.mylist))
+        self.assertEqual([1, 2, 3], m1.mylist + [3])
+        self.assertEqual([0, 1, 2], [0] + m1.mylist)
+        self.assertTrue(m1.mylist == [1, 2])
+
+    def testReplaceEqual(self):
+        # the replaced list must not notify anymore, even if it has
+        # the same content of the new one
+        class Obs (Observer):
+            calls = 0
+            @Observer.observe("mylist", after=True)
+            def changed(self, model, name, info): self.calls += 1
+
+        m = MyModel()
+        m.mylist = [1, 2] # not to change the class default
+        o = Obs(m)
+        old = m.mylist
+        m.mylist = [1, 2]
+        old.append(3)
+        self.assertEqual(0, o.calls)
+        m.mylist.append(3)
+        self.assertEqual(1, o.calls)
+    pass
+
 if __name__ == "__main__":
     unittest.main()
@@ -16,6 +16,23 @@ try:
         __observables__ = ["?name", "aaa"]
         pass
     
+    class Cached(SQLObjectModel):
+        fname = StringCol()
+        lname = StringCol()
+        __observables__ = ["?name", "full"]
+
+        @SQLObjectModel.getter(deps=["fname", "lname"], cache=True)
+        def full(self):
+            return "%s %s" % (self.fname, self.lname)
+        pass
+
+    class FullTrigger(Observer):
+        @Observer.observe("full", assign=True)
+        def full_change(self, model, prop_name, info):
+            self.full = info.new
+            return
+        pass
+
     class Student(Person):
         year = StringCol()
         pass
@@ -67,6 +84,17 @@ try:
             self.assertEqual((1, 2), t.aaa)
             return
         
+        def testCachedGetter(self):
+            p = Cached(fname="John", lname="Doe")
+            # full is read while notifying, before columns are updated
+            t = FullTrigger(p)
+            self.assertEqual("John Doe", p.full)
+            p.fname = "Ciccio"
+            self.assertEqual("Ciccio Doe", p.full)
+            p.lname = "Bibo"
+            self.assertEqual("Ciccio Bibo", p.full)
+            return
+
         def testInheritance(self):
             s = Student(fname="rob", lname="bibo", year="1974")
             self.assertEqual("rob", s.fname)
@@ -0,0 +1,148 @@
+"""
+Test for the bulk loading of ListStoreModel and TreeStoreModel.
+"""
+
+import logging
+import unittest
+
+from gi.repository import Gtk
+
+import _importer
+from _importer import refresh_gui
+
+import gtkmvc3
+
+class Store(gtkmvc3.ListStoreModel):
+    def __init__(self):
+        gtkmvc3.ListStoreModel.__init__(self, int, str)
+
+class Tree(gtkmvc3.TreeStoreModel):
+    def __init__(self):
+        gtkmvc3.TreeStoreModel.__init__(self, int)
+
+class Observer(gtkmvc3.Observer):
+    def __init__(self, model):
+        gtkmvc3.Observer.__init__(self)
+        self.reloaded = []
+        self.views = []
+        self.observe_model(model)
+
+    @gtkmvc3.Observer.observe("reloaded", signal=True)
+    def on_reloaded(self, model, name, info):
+        self.reloaded.append(info.arg)
+        self.views.append([view.get_model() for view in self.attached])
+
+class ListStore(unittest.TestCase):
+    def setUp(self):
+        self.store = Store()
+        self.store.append([-1, "first"])
+        self.obs = Observer(self.store)
+        self.view = Gtk.TreeView(model=self.store)
+        self.obs.attached = [self.view]
+        self.inserted = 0
+        self.store.connect("row-inserted", self.on_inserted)
+
+    def on_inserted(self, *args):
+        self.inserted += 1
+
+    def testExtend(self):
+        n = self.store.extend(((i, str(i)) for i in range(100)),
+                              views=[self.view])
+        self.assertEqual(100, n)
+        self.assertEqual(101, len(self.store))
+        self.assertEqual([-1, "first"], list(self.store[0]))
+        self.assertEqual([99, "99"], list(self.store[100]))
+        self.assertEqual([100], self.obs.reloaded)
+        # views are attached again before observers are notified
+        self.assertEqual([[self.store]], self.obs.views)
+
+    def testReplaceAll(self):
+        self.store.replace_all([(i, str(i)) for i in range(10)],
+                               views=[self.view])
+        self.assertEqual(10, len(self.store))
+        self.assertEqual([0, "0"], list(self.store[0]))
+        self.assertEqual([10], self.obs.reloaded)
+        self.assertTrue(self.view.get_model() is self.store)
+
+    def testIndependentSignals(self):
+        other = Observer(Store())
+        self.store.extend([])
+        self.assertEqual([0], self.obs.reloaded)
+        self.assertEqual([], other.reloaded)
+
+class TreeStore(unittest.TestCase):
+    def setUp(self):
+        self.store = Tree()
+        self.store.append(None, [-1])
+        self.obs = Observer(self.store)
+        self.obs.attached = []
+
+    def testLoad(self):
+        nodes = [((0,), [((1,), [((2,), [])]),
+                         ((3,), [])]),
+                 ((4,), [])]
+        self.assertEqual(5, self.store.load(nodes))
+        self.assertEqual([5], self.obs.reloaded)
+        self.assertEqual(2, self.store.iter_n_children(None))
+        first = self.store.get_iter_first()
+        self.assertEqual(0, self.store[first][0])
+        self.assertEqual(2, self.store.iter_n_children(first))
+        self.assertEqual(2, self.store[(0, 0, 0)][0])
+        self.assertEqual(3, self.store[(0, 1)][0])
+        self.assertEqual(4, self.store[(1,)][0])
+
+    def testDeep(self):
+        node = ((0,), [])
+        for i in range(1, 2000):
+            node = ((i,), [node])
+        self.assertEqual(2000, self.store.load([node]))
+
+
+class Subclasses(unittest.TestCase):
+    def testOwnReloaded(self):
+        class Own(gtkmvc3.ListStoreModel):
+            reloaded = 0
+
+            def __init__(self):
+                gtkmvc3.ListStoreModel.__init__(self, int)
+
+        store = Own()
+        self.assertEqual(0, store.reloaded)
+        self.assertEqual(2, store.extend([(1,), (2,)]))
+        self.assertEqual(0, store.reloaded)
+
+    def testBaseInitSkipped(self):
+        class Direct(gtkmvc3.ListStoreModel):
+            def __init__(self):
+                Gtk.ListStore.__init__(self, int)
+                gtkmvc3.Model.__init__(self)
+
+        store = Direct()
+        self.assertEqual(2, store.extend([(1,), (2,)]))
+        store.replace_all([(3,)])
+        self.assertEqual(1, len(store))
+
+
+class Adapt(unittest.TestCase):
+    def testNoWarning(self):
+        records = []
+
+        class Handler (logging.Handler):
+            def emit(self, record):
+                records.append(record.getMessage())
+
+        handler = Handler(logging.WARNING)
+        logger = logging.getLogger("gtkmvc3")
+        logger.addHandler(handler)
+        try:
+            for store in (Store(), Tree()):
+                c = gtkmvc3.Controller(store, gtkmvc3.View())
+                refresh_gui()
+                # the reloaded signal is not matched to widgets
+                c.adapt()
+        finally:
+            logger.removeHandler(handler)
+        self.assertEqual([], records)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+"""
+Test for the subscriptions to single properties, and for adapters
+using them.
+"""
+
+import functools
+import unittest
+
+import _importer
+
+import gtkmvc3
+from gtkmvc3.adapters import Adapter
+from gtkmvc3.observable import Signal
+
+
+class Child (gtkmvc3.Model):
+    val = 0
+    __observables__ = ("val",)
+
+
+class Model (gtkmvc3.Model):
+    a = 0
+    b = 0
+    lst = []
+    child = None
+    __observables__ = ("a", "b", "lst", "child")
+
+    def __init__(self):
+        gtkmvc3.Model.__init__(self)
+        self.child = Child()
+
+
+class ModelMT (gtkmvc3.ModelMT):
+    a = 0
+    __observables__ = ("a",)
+
+
+class Widget (object):
+    """Emulates an entry"""
+    def __init__(self):
+        self.text = ""
+
+    def connect(self, signal, handler):
+        pass
+
+    def get(self):
+        return self.text
+
+    def set(self, value):
+        self.text = str(value)
+
+
+class Subscribe (unittest.TestCase):
+    def setUp(self):
+        self.m = Model()
+        self.calls = []
+
+    def callback(self, model, name, info):
+        self.assertIs(self.m, model)
+        for kind in ("assign", "before", "after", "signal"):
+            if info.get(kind):
+                self.calls.append((name, kind))
+
+    def test_assign(self):
+        sub = self.m.subscribe("a", self.callback)
+        self.assertIs(self.m, sub.model)
+        self.m.a = 1
+        self.m.b = 1
+        self.m.a = 1
+        self.assertEqual([("a", "assign")], self.calls)
+        self.assertFalse(self.m._has_observer("b"))
+
+    def test_names_and_kwargs(self):
+        def callback(model, name, info):
+            self.calls.append((name, info.new, info.extra))
+        self.m.subscribe(["a", "b"], callback, spurious=True, extra=5)
+        self.m.a = 1
+        self.m.b = 0
+        self.assertEqual([("a", 1, 5), ("b", 0, 5)], self.calls)
+
+    def test_kinds(self):
+        self.m.subscribe("lst", self.callback, kinds=("assign", "after"))
+        self.m.lst.append(1)
+        self.m.lst = 3
+        self.m.lst = [4]
+        self.m.lst.append(5)
+        self.assertEqual([("lst", "after"), ("lst", "assign"),
+                          ("lst", "assign"), ("lst", "after")], self.calls)
+
+    def test_signal(self):
+        self.m.a = Signal()
+        self.m.subscribe("a", self.callback, kinds=("signal",))
+        self.m.a.emit()
+        self.assertEqual([("a", "signal")], self.calls)
+
+    def test_cancel(self):
+        sub = self.m.subscribe("a", self.callback)
+        sub.cancel()
+        sub.cancel()
+        self.m.a = 1
+        self.assertEqual([], self.calls)
+        self.assertFalse(self.m._has_observer())
+        self.assertFalse(self.m._is_observed())
+
+    def test_errors(self):
+        self.assertRaises(ValueError, self.m.subscribe, "c", self.callback)
+        self.assertRaises(ValueError, self.m.subscribe, "a*", self.callback)
+        self.assertRaises(ValueError, self.m.subscribe, "a", self.callback,
+                          kinds=("changed",))
+        self.assertFalse(self.m._is_observed())
+
+    def test_callable_without_name(self):
+        sub = self.m.subscribe("a", functools.partial(self.callback))
+        self.m.a = 1
+        sub.cancel()
+        self.assertEqual([("a", "assign")], self.calls)
+        self.assertFalse(self.m._is_observed())
+
+    def test_failure_rolled_back(self):
+        class Unhashable (object):
+            __hash__ = None
+
+            def __call__(self, model, name, info):
+                pass
+
+        self.assertRaises(TypeError, self.m.subscribe, ["a", "b"],
+                          Unhashable())
+        self.assertFalse(self.m._has_observer())
+        self.assertFalse(self.m._is_observed())
+
+    def test_model_mt(self):
+        m = ModelMT()
+        sub = m.subscribe("a", lambda model, name, info:
+                          self.calls.append(info.new))
+        m.a = 1
+        sub.cancel()
+        m.a = 2
+        self.assertEqual([1], self.calls)
+
+
+class AdapterSubscription (unittest.TestCase):
+    def setUp(self):
+        self.m = Model()
+        self.w = Widget()
+
+    def test_only_property(self):
+        ad = Adapter(self.m, "a")
+        ad.connect_widget(self.w, Widget.get, Widget.set, "changed")
+        self.m.a = 3
+        self.assertEqual("3", self.w.text)
+        self.assertFalse(self.m._has_observer("b"))
+        self.assertFalse([name for name in vars(ad)
+                          if name.startswith("property_")])
+
+    def test_relieve(self):
+        ad = Adapter(self.m, "a")
+        ad.connect_widget(self.w, Widget.get, Widget.set, "changed")
+        ad.relieve_model(self.m)
+        self.m.a = 3
+        self.assertEqual("0", self.w.text)
+        self.assertFalse(self.m._has_observer())
+
+    def test_intermediate(self):
+        ad = Adapter(self.m, "child.val")
+        ad.connect_widget(self.w, Widget.get, Widget.set, "changed")
+        old = self.m.child
+        self.m.child = Child()
+        self.m.child.val = 2
+        self.assertEqual("2", self.w.text)
+        old.val = 1
+        self.assertEqual("2", self.w.text)
+        self.assertFalse(old._has_observer())
+
+
+if __name__ == "__main__":
+    unittest.main()
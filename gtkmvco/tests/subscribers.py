@@ -0,0 +1,100 @@
+"""
+Test for the counters of stored notifications, which allow setters
+to skip notifications when nobody is listening.
+"""
+
+import _importer
+from gtkmvc3 import Model, Observer
+
+import unittest
+
+
+class MyModel (Model):
+    val = 0
+    lst = []
+    __observables__ = ("val", "lst", "log")
+
+    @Model.getter(deps=["val"])
+    def log(self): return self.val + 1
+
+
+class ValObserver (Observer):
+    def __init__(self, model=None):
+        Observer.__init__(self, model)
+        self.notif = []
+
+    @Observer.observe("val", assign=True)
+    def val_assign(self, model, name, info):
+        self.notif.append((name, info.old, info.new))
+
+    @Observer.observe("lst", before=True)
+    def lst_before(self, model, name, info):
+        self.notif.append((name, info.method_name))
+
+
+class LogObserver (Observer):
+    def __init__(self, model=None):
+        Observer.__init__(self, model)
+        self.notif = []
+
+    @Observer.observe("log", assign=True)
+    def log_assign(self, model, name, info):
+        self.notif.append((name, info.old, info.new))
+
+
+class SubscribersTest (unittest.TestCase):
+    def setUp(self):
+        self.m = MyModel()
+
+    def test_no_observer(self):
+        self.assertFalse(self.m._has_observer())
+        self.m.val = 5
+        self.m.lst = [1, 2]
+        self.m.lst.append(3)
+        self.assertEqual(self.m.log, 6)
+        self.assertFalse(self.m._has_observer())
+
+    def test_register_unregister(self):
+        o = ValObserver(self.m)
+        self.assertTrue(self.m._has_observer())
+        self.assertTrue(self.m._has_observer("val"))
+        self.assertTrue(self.m._has_observer("lst"))
+        self.assertFalse(self.m._has_observer("log"))
+
+        o.relieve_model(self.m)
+        self.assertFalse(self.m._has_observer())
+        self.assertFalse(self.m._has_observer("val"))
+        self.assertFalse(self.m._has_observer("lst"))
+
+    def test_reset_property(self):
+        o = ValObserver(self.m)
+        # replacing the list keeps the before notification
+        self.m.lst = [4]
+        self.assertTrue(self.m._has_observer("lst"))
+        self.m.lst.append(5)
+        self.assertEqual(o.notif, [("lst", "append")])
+
+        # a non-wrapper value cannot have before notifications
+        self.m.lst = 0
+        self.assertFalse(self.m._has_observer("lst"))
+        self.m.lst = [6]
+        self.assertTrue(self.m._has_observer("lst"))
+
+    def test_list_replaced_without_observers(self):
+        old = self.m.lst
+        self.m.lst = [1]
+        o = ValObserver(self.m)
+        # the old wrapper must not notify anymore
+        old.append(2)
+        self.assertEqual(o.notif, [])
+        self.m.lst.append(3)
+        self.assertEqual(o.notif, [("lst", "append")])
+
+    def test_dependencies(self):
+        o = LogObserver(self.m)
+        self.m.val = 1
+        self.assertEqual(o.notif, [("log", 1, 2)])
+
+
+if __name__ == "__main__":
+    unittest.main()
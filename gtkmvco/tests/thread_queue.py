@@ -0,0 +1,124 @@
+"""
+Test for the queue of notifications coming from other threads in
+ModelMT.
+"""
+
+import threading
+
+import _importer
+from _importer import refresh_gui
+from gtkmvc3 import ModelMT, Observer
+from gtkmvc3.observable import Signal
+
+import unittest
+
+
+class MyModel (ModelMT):
+    counter = 0
+    sgn = Signal()
+    __observables__ = ("counter", "sgn")
+
+
+class CoalescingModel (MyModel):
+    coalesce_notifications = True
+
+
+class MyObserver (Observer):
+    def __init__(self, model):
+        Observer.__init__(self, model)
+        self.notif = []
+
+    @Observer.observe("counter", assign=True)
+    def counter_assign(self, model, name, info):
+        self.notif.append(("assign", info.new))
+
+    @Observer.observe("sgn", signal=True)
+    def sgn_emit(self, model, name, info):
+        self.notif.append(("signal", info.arg))
+
+
+class AnyObserver (Observer):
+    """Uses the same method for assignments and signals"""
+    def __init__(self, model):
+        Observer.__init__(self, model)
+        self.notif = []
+
+    @Observer.observe("counter", assign=True)
+    @Observer.observe("sgn", signal=True)
+    def on_any(self, model, name, info):
+        self.notif.append((name, info.new if info.get("assign") else info.arg))
+
+
+class Emitter (Observer):
+    """Emits the signal from within the assignment notification"""
+    @Observer.observe("counter", assign=True)
+    def counter_assign(self, model, name, info):
+        model.sgn.emit(info.new)
+
+
+def work(model):
+    for i in range(1, 101):
+        model.counter = i
+        if i % 50 == 0:
+            model.sgn.emit(i)
+
+
+def run_thread(model):
+    t = threading.Thread(target=work, args=(model,))
+    t.start()
+    t.join()
+
+
+class QueueTest (unittest.TestCase):
+    def test_no_coalescing(self):
+        m = MyModel()
+        o = MyObserver(m)
+        run_thread(m)
+        self.assertEqual(o.notif, [])
+        refresh_gui()
+        self.assertEqual(len(o.notif), 102)
+        self.assertEqual(o.notif[-2:], [("assign", 100), ("signal", 100)])
+        self.assertEqual(o.notif[50], ("signal", 50))
+        self.assertEqual(m.get_notification_stats(),
+                         {'delivered': 102, 'coalesced': 0})
+
+    def test_coalescing(self):
+        m = CoalescingModel()
+        o = MyObserver(m)
+        run_thread(m)
+        refresh_gui()
+        # signals are all delivered, in order
+        self.assertEqual(o.notif, [("signal", 50), ("assign", 100),
+                                   ("signal", 100)])
+        self.assertEqual(m.get_notification_stats(),
+                         {'delivered': 3, 'coalesced': 99})
+
+    def test_signal_in_assign(self):
+        m = CoalescingModel()
+        o = AnyObserver(m)
+
+        def emit_work():
+            Emitter(m)
+            m.counter = 1
+            m.counter = 2
+
+        t = threading.Thread(target=emit_work)
+        t.start()
+        t.join()
+        refresh_gui()
+        # the signals are not mistaken for assignments to counter
+        self.assertEqual(o.notif, [("sgn", 1), ("counter", 2), ("sgn", 2)])
+        self.assertEqual(m.get_notification_stats(),
+                         {'delivered': 3, 'coalesced': 1})
+
+    def test_same_thread(self):
+        m = CoalescingModel()
+        o = MyObserver(m)
+        work(m)
+        self.assertEqual(len(o.notif), 102)
+        self.assertEqual(m.get_notification_stats(),
+                         {'delivered': 0, 'coalesced': 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
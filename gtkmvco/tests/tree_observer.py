@@ -19,7 +19,7 @@ import unittest
 
 from gi.repository import Gtk
 
-import _importer
+from _importer import refresh_gui
 
 import gtkmvc3
 
@@ -43,5 +43,47 @@ class CustomColumn(unittest.TestCase):
     def testWatch(self):
         gtkmvc3.adapters.containers.watch_items_in_tree(self.store, 1)
 
+class Inserted(unittest.TestCase):
+    def setUp(self):
+        self.store = Gtk.ListStore(object)
+        self.changed = []
+        self.store.connect('row-changed',
+                           lambda tree, path, iter: self.changed.append(
+                               path.get_indices()[0]))
+
+    def testAppendAfterWatch(self):
+        gtkmvc3.adapters.containers.watch_items_in_tree(self.store)
+        row = Row()
+        self.store.append([row])
+        row.value = 1
+        self.assertEqual([0], self.changed)
+
+class Batch(unittest.TestCase):
+    def setUp(self):
+        self.store = Gtk.ListStore(object)
+        self.items = [Row() for i in range(3)]
+        for item in self.items:
+            self.store.append([item])
+        gtkmvc3.adapters.containers.watch_items_in_tree(self.store,
+                                                        batch=True)
+        self.changed = []
+        self.store.connect('row-changed',
+                           lambda tree, path, iter: self.changed.append(
+                               path.get_indices()[0]))
+
+    def testOncePerRow(self):
+        for i in range(5):
+            self.items[2].value = i
+            self.items[0].value = i
+        self.assertEqual([], self.changed)
+        refresh_gui()
+        self.assertEqual([0, 2], self.changed)
+
+    def testRemovedRow(self):
+        self.items[1].value = 1
+        self.store.remove(self.store.get_iter(1))
+        refresh_gui()
+        self.assertEqual([], self.changed)
+
 if __name__ == "__main__":
     unittest.main()
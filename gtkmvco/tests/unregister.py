@@ -0,0 +1,101 @@
+"""
+Test for removing observers, also while notifications are being sent.
+"""
+
+import unittest
+
+import _importer
+
+from gtkmvc3 import Observer, Model
+
+class M(Model):
+    a = 0
+    b = 0
+    __observables__ = ("a", "b")
+
+class Obs(Observer):
+    def __init__(self, name, calls, model=None):
+        Observer.__init__(self)
+        self.name = name
+        self.calls = calls
+        self.others = []
+        if model is not None:
+            self.observe_model(model)
+
+    @Observer.observe("a", assign=True)
+    @Observer.observe("b", assign=True)
+    def on_change(self, model, name, info):
+        self.calls.append((self.name, name))
+        for other in self.others:
+            other.relieve_model(model)
+
+    def property_a_value_change(self, model, old, new):
+        self.calls.append((self.name, "old"))
+
+class Adder(Observer):
+    def __init__(self, other):
+        Observer.__init__(self)
+        self.other = other
+
+    @Observer.observe("b", assign=True)
+    def on_b(self, model, name, info):
+        self.other.observe_model(model)
+
+class Unregister(unittest.TestCase):
+    def setUp(self):
+        self.m = M()
+        self.calls = []
+        self.obs = [Obs(i, self.calls, self.m) for i in range(4)]
+
+    def testOrder(self):
+        self.m.b = 1
+        self.assertEqual([(i, "b") for i in range(4)], self.calls)
+
+    def testOldAndNewStyle(self):
+        self.m.a = 1
+        self.assertEqual(8, len(self.calls))
+        self.assertEqual([(0, "a"), (0, "old")], sorted(self.calls[:2]))
+
+    def testUnregister(self):
+        self.obs[1].relieve_model(self.m)
+        self.obs[1].relieve_model(self.m)
+        self.m.b = 1
+        self.assertEqual([(0, "b"), (2, "b"), (3, "b")], self.calls)
+        self.assertFalse(self.m._has_observer("x"))
+        self.assertTrue(self.m._has_observer("a"))
+
+    def testUnregisterAll(self):
+        for o in self.obs:
+            o.relieve_model(self.m)
+        self.assertFalse(self.m._has_observer())
+        self.assertFalse(self.m._is_observed())
+        self.m.a = 1
+        self.assertEqual([], self.calls)
+
+    def testRegisterAgain(self):
+        self.obs[0].relieve_model(self.m)
+        self.obs[0].observe_model(self.m)
+        self.m.b = 1
+        self.assertEqual([1, 2, 3, 0], [name for name, _ in self.calls])
+
+    def testWhileNotifying(self):
+        # observers removed by a previous one are not called
+        self.obs[0].others = [self.obs[2], self.obs[0]]
+        self.m.b = 1
+        self.assertEqual([(0, "b"), (1, "b"), (3, "b")], self.calls)
+        del self.calls[:]
+        self.m.b = 2
+        self.assertEqual([(1, "b"), (3, "b")], self.calls)
+
+    def testAddWhileNotifying(self):
+        # observers added meanwhile are called from the next change
+        new = Obs(4, self.calls)
+        Adder(new).observe_model(self.m)
+        self.m.b = 1
+        self.assertEqual([0, 1, 2, 3], [name for name, _ in self.calls])
+        del self.calls[:]
+        self.m.b = 2
+        self.assertEqual([0, 1, 2, 3, 4], [name for name, _ in self.calls])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+"""Measures observers unregistered per second from a model."""
+
+import logging
+import timeit
+
+import _importer
+import gtkmvc3
+
+logging.getLogger("gtkmvc3").setLevel(logging.ERROR)
+
+
+PROPS = dict(("prop%d" % i, 0) for i in range(50))
+PROPS["__observables__"] = sorted(PROPS)
+MyModel = type(gtkmvc3.Model)("MyModel", (gtkmvc3.Model,), PROPS)
+
+
+class MyObserver (gtkmvc3.Observer):
+    @gtkmvc3.Observer.observe("prop0", assign=True)
+    @gtkmvc3.Observer.observe("prop1", assign=True)
+    @gtkmvc3.Observer.observe("prop2", assign=True)
+    def on_change(self, model, name, info): pass
+
+
+def unregister(N):
+    m = MyModel()
+    observers = [MyObserver() for _ in range(N)]
+    for o in observers:
+        m.register_observer(o)
+    t = timeit.default_timer()
+    for o in observers:
+        m.unregister_observer(o)
+    return timeit.default_timer() - t
+
+
+if __name__ == "__main__":
+    for N in (100, 1000, 5000):
+        print("%5d observers %10d unregistrations/second" % (
+              N, N / min(unregister(N) for _ in range(3))))
@@ -0,0 +1,72 @@
+"""
+Test for the index of widget names kept by views.
+"""
+
+import _importer
+from gi.repository import Gtk
+
+import gtkmvc3
+
+import unittest
+
+UI = """<?xml version="1.0"?>
+<interface>
+  <object class="GtkWindow" id="window">
+    <child>
+      <object class="GtkBox" id="box">
+        <child>
+          <object class="GtkEntry" id="entry_Name"/>
+        </child>
+        <child>
+          <object class="GtkLabel" id="label_name"/>
+        </child>
+      </object>
+    </child>
+  </object>
+</interface>
+"""
+
+
+class CountingBuilder (Gtk.Builder):
+    def __init__(self):
+        Gtk.Builder.__init__(self)
+        self.walks = 0
+
+    def get_objects(self):
+        self.walks += 1
+        return Gtk.Builder.get_objects(self)
+
+
+class ViewIndexTest (unittest.TestCase):
+    def setUp(self):
+        self.builder = CountingBuilder()
+        self.builder.add_from_string(UI)
+        self.v = gtkmvc3.View(builder=self.builder)
+
+    def test_walked_once(self):
+        names = set(self.v)
+        self.assertEqual(names, set(["window", "box",
+                                     "entry_Name", "label_name"]))
+        self.assertEqual(set(self.v), names)
+        self.v.get_names_ending_with("name")
+        self.assertEqual(self.builder.walks, 1)
+
+    def test_suffix(self):
+        self.assertEqual(sorted(self.v.get_names_ending_with("NAME")),
+                         ["entry_Name", "label_name"])
+        self.assertEqual(self.v.get_names_ending_with("_name"),
+                         self.v.get_names_ending_with("name"))
+        self.assertEqual(self.v.get_names_ending_with("box"), ("box",))
+        self.assertEqual(self.v.get_names_ending_with("missing"), ())
+
+    def test_setitem_invalidates(self):
+        self.assertEqual(self.v.get_names_ending_with("surname"), ())
+        self.v["entry_surname"] = Gtk.Entry()
+        self.assertEqual(self.v.get_names_ending_with("surname"),
+                         ("entry_surname",))
+        self.assertTrue("entry_surname" in list(self.v))
+        self.assertEqual(self.builder.walks, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
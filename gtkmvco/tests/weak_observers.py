@@ -0,0 +1,207 @@
+"""
+Test for observers registered with weak references.
+"""
+
+import gc
+import unittest
+import weakref
+
+from _importer import refresh_gui
+
+import gtkmvc3
+from gtkmvc3 import Observer, Model, ModelMT
+from gtkmvc3.adapters import Adapter
+
+class M(Model):
+    a = 0
+    s = None
+    __observables__ = ("a", "s")
+
+    def __init__(self):
+        Model.__init__(self)
+        self.s = gtkmvc3.observable.Signal()
+
+class WeakM(M):
+    weak_observers = True
+
+class MT(ModelMT):
+    a = 0
+    __observables__ = ("a",)
+
+class Legacy(M):
+    """Overrides register_observer with the former signature"""
+    def register_observer(self, observer):
+        self.registered = observer
+        M.register_observer(self, observer)
+
+class Obs(Observer):
+    def __init__(self, calls):
+        Observer.__init__(self)
+        self.calls = calls
+
+    @Observer.observe("a", assign=True)
+    def on_a(self, model, name, info):
+        self.calls.append(info.new)
+
+    @Observer.observe("s", signal=True)
+    def on_s(self, model, name, info):
+        self.calls.append(info.arg)
+
+class OldStyle(Observer):
+    def __init__(self, calls):
+        Observer.__init__(self)
+        self.calls = calls
+
+    def property_a_value_change(self, model, old, new):
+        self.calls.append(new)
+
+    @Observer.observe("a", assign=True, old_style_call=True)
+    def on_a(self, model, name, old, new):
+        self.calls.append((name, new))
+
+class Dropper(Observer):
+    def __init__(self, others):
+        Observer.__init__(self)
+        self.others = others
+
+    @Observer.observe("a", assign=True)
+    def on_a(self, model, name, info):
+        # collects the observer notified next
+        del self.others[:]
+        gc.collect()
+
+class Ctrl(gtkmvc3.Controller):
+    calls = []
+
+    @gtkmvc3.Controller.observe("a", assign=True)
+    def on_a(self, model, name, info):
+        self.calls.append(info.new)
+
+class Weak(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+
+    def testStrongByDefault(self):
+        m = M()
+        m.register_observer(Obs(self.calls))
+        gc.collect()
+        m.a = 1
+        self.assertEqual([1], self.calls)
+
+    def testReleased(self):
+        m = M()
+        o = Obs(self.calls)
+        m.register_observer(o, weak=True)
+        m.a = 1
+        m.s.emit(2)
+        ref = weakref.ref(o)
+        del o
+        gc.collect()
+        self.assertTrue(ref() is None)
+        m.a = 3
+        m.s.emit(4)
+        self.assertEqual([1, 2], self.calls)
+        self.assertFalse(m._has_observer())
+        self.assertFalse(m._is_observed())
+
+    def testOldStyle(self):
+        m = M()
+        o = OldStyle(self.calls)
+        m.register_observer(o, weak=True)
+        m.a = 1
+        ref = weakref.ref(o)
+        del o
+        gc.collect()
+        self.assertTrue(ref() is None)
+        m.a = 2
+        self.assertEqual(sorted([1, ("a", 1)], key=repr),
+                         sorted(self.calls, key=repr))
+
+    def testUnregister(self):
+        m = M()
+        o = Obs(self.calls)
+        o.observe_model(m, weak=True)
+        o.observe_model(m, weak=True)
+        m.a = 1
+        o.relieve_model(m)
+        m.a = 2
+        self.assertEqual([1], self.calls)
+        self.assertFalse(m._is_observed())
+
+    def testCollectedWhileNotifying(self):
+        m = M()
+        others = [Obs(self.calls)]
+        m.register_observer(Dropper(others))
+        m.register_observer(others[0], weak=True)
+        m.a = 1
+        m.a = 2
+        self.assertEqual([], self.calls)
+        self.assertFalse(others)
+
+    def testModelMT(self):
+        m = MT()
+        o = Obs(self.calls)
+        m.register_observer(o, weak=True)
+        m.a = 1
+        ref = weakref.ref(o)
+        del o
+        gc.collect()
+        self.assertTrue(ref() is None)
+        m.a = 2
+        self.assertEqual([1], self.calls)
+
+    def testSubscription(self):
+        m = WeakM()
+        o = Obs(self.calls)
+        sub = m.subscribe("a", o.on_a)
+        m.a = 1
+        self.assertEqual(o.on_a, sub.callback)
+        ref = weakref.ref(o)
+        del o
+        gc.collect()
+        self.assertTrue(ref() is None)
+        self.assertTrue(sub.callback is None)
+        m.a = 2
+        self.assertEqual([1], self.calls)
+        self.assertFalse(m._is_observed())
+
+    def testStrongSubscription(self):
+        m = M()
+        sub = m.subscribe("a", Obs(self.calls).on_a)
+        gc.collect()
+        m.a = 1
+        self.assertEqual([1], self.calls)
+
+    def testAdapterReleased(self):
+        m = WeakM()
+        ad = Adapter(m, "a")
+        ref = weakref.ref(ad)
+        del ad
+        gc.collect()
+        self.assertTrue(ref() is None)
+        self.assertFalse(m._is_observed())
+
+    def testLegacyOverride(self):
+        m = Legacy()
+        o = Obs(self.calls)
+        o.observe_model(m)
+        self.assertTrue(m.registered is o)
+        m.a = 1
+        self.assertEqual([1], self.calls)
+
+class ClosedController(unittest.TestCase):
+    def testReleased(self):
+        Ctrl.calls = []
+        m = WeakM()
+        c = Ctrl(m, gtkmvc3.View())
+        refresh_gui()
+        m.a = 1
+        ref = weakref.ref(c)
+        del c
+        gc.collect()
+        self.assertTrue(ref() is None)
+        m.a = 2
+        self.assertEqual([1], Ctrl.calls)
+
+if __name__ == "__main__":
+    unittest.main()
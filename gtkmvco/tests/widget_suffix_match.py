@@ -0,0 +1,67 @@
+"""
+Test for matching widgets to properties by the suffix of their names.
+"""
+
+import logging
+import unittest
+
+from gi.repository import Gtk
+
+from _importer import refresh_gui
+
+import gtkmvc3
+from gtkmvc3.support.exceptions import TooManyCandidatesError
+
+
+class Model (gtkmvc3.Model):
+    name = ""
+    age = 0
+    city = ""
+    zip = ""
+    __observables__ = ("name", "age", "city", "zip")
+
+
+class Ctrl (gtkmvc3.Controller):
+    pass
+
+
+class SuffixMatch (unittest.TestCase):
+    def setUp(self):
+        self.m = Model()
+        self.v = gtkmvc3.View()
+        self.v["entry_Name"] = Gtk.Entry()
+        self.v["label_age"] = Gtk.Label()
+        self.c = Ctrl(self.m, self.v)
+        refresh_gui()
+
+    def test_match(self):
+        self.assertEqual(self.c._find_widget_match("name"), "entry_Name")
+        self.assertEqual(self.c._find_widget_match("AGE"), "label_age")
+        self.assertRaises(ValueError, self.c._find_widget_match, "city")
+
+    def test_ambiguous(self):
+        self.v["label_name"] = Gtk.Label()
+        self.assertRaises(TooManyCandidatesError,
+                          self.c._find_widget_match, "name")
+        self.assertRaises(TooManyCandidatesError, self.c.adapt)
+
+    def test_single_warning(self):
+        records = []
+
+        class Handler (logging.Handler):
+            def emit(self, record):
+                records.append(record.getMessage())
+
+        handler = Handler(logging.WARNING)
+        logger = logging.getLogger("gtkmvc3")
+        logger.addHandler(handler)
+        try:
+            self.c.adapt()
+        finally:
+            logger.removeHandler(handler)
+        self.assertEqual(records, ["No widget candidates match "
+                                   "properties: city, zip"])
+
+
+if __name__ == "__main__":
+    unittest.main()